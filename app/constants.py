@@ -1,24 +1,58 @@
 # -*- coding: utf-8 -*-
 
 import os
-import sys
-import paramiko
 from enum import Enum
+from types import MappingProxyType
 from app.task_notification import NotificationMethod
 
+
+def env_int(name: str, default: int) -> int:
+    """
+    Get an integer setting from the environment, or the default if it is not set.
+    Settings are parsed once, here, so that callers can use them without conversion.
+    """
+    return int(os.environ.get(name, default))
+
+
+def env_bool(name: str, default: bool) -> bool:
+    """
+    Get a boolean setting from the environment ("true", "1" or "yes", in any case),
+    or the default if it is not set.
+    """
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.lower() in ("true", "1", "yes")
+
+
 """
 Application name and port
 """
 APP_NAME = os.environ.get("FLASK_APP_NAME", "slurm-proxy")
-APP_PORT = os.environ.get("FLASK_APP_PORT", 5001)
+APP_PORT = env_int("FLASK_APP_PORT", 5001)
 APP_HOST = os.environ.get("FLASK_APP_HOST", "0.0.0.0")
-APP_DEBUG_MODE = os.environ.get("FLASK_APP_DEBUG_MODE", True)
-APP_USE_RELOADER = os.environ.get("FLASK_APP_USE_RELOADER", True)
+APP_DEBUG_MODE = env_bool("FLASK_APP_DEBUG_MODE", True)
+APP_USE_RELOADER = env_bool("FLASK_APP_USE_RELOADER", True)
+
+"""
+When run.py serves the application with the Werkzeug reloader, it sets this environment
+variable, so that the reloader's watcher process (which only restarts the server process
+on code changes) does not also connect to MongoDB and poll the SLURM scheduler.
+"""
+APP_RELOADER_ENV = "SLURM_PROXY_USE_RELOADER"
+
+
+def freeze_metadata(value):
+    """
+    Recursively convert metadata dictionaries into read-only mappings, and lists
+    into tuples, so that shared module-level metadata cannot be modified in place.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze_metadata(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze_metadata(v) for v in value)
+    return value
 
-if isinstance(APP_DEBUG_MODE, str): 
-    APP_DEBUG_MODE = True if APP_DEBUG_MODE.lower() in ("true", "1", "yes") else False
-if isinstance(APP_USE_RELOADER, str):
-    APP_USE_RELOADER = True if APP_USE_RELOADER.lower() in ("true", "1", "yes") else False
 
 """
 These parameters are used to define the tasks that can be submitted to the SLURM scheduler
@@ -34,8 +68,11 @@ command.
 
 The `notification_queue` parameter is the name of the RabbitMQ queue that will be used to
 send notifications about a completed task. This queue name should be specific to the task.
+
+Task metadata are read-only. Callers that need to extend them (e.g., with custom
+notification methods) must work on a copy.
 """
-TASK_METADATA = {
+TASK_METADATA = freeze_metadata({
     "echo_hello_world": {
         "cmd": "echo",
         "default_params": ["-e", "\"hello, world! (sent job $SLURM_JOB_ID to $SLURM_JOB_USER at `date`)\""],
@@ -76,7 +113,17 @@ TASK_METADATA = {
             "params": {},
         },
     }
-}
+})
+
+"""
+Notification dispatch parameters
+
+Notification messages for job state changes are sent from a pool of
+NOTIFICATIONS_MAX_WORKERS threads. If NOTIFICATIONS_MAX_PENDING messages are
+already waiting, further messages are sent directly by the monitor.
+"""
+NOTIFICATIONS_MAX_WORKERS = env_int("NOTIFICATIONS_MAX_WORKERS", 4)
+NOTIFICATIONS_MAX_PENDING = env_int("NOTIFICATIONS_MAX_PENDING", 1024)
 
 """
 RabbitMQ connection parameters
@@ -90,7 +137,7 @@ https://github.com/Altius/messaging for more details on host, port, username,
 password, path and other parameters.
 """
 NOTIFICATIONS_RABBITMQ_HOST = os.environ.get("RABBITMQ_HOST", "localhost")
-NOTIFICATIONS_RABBITMQ_PORT = os.environ.get("RABBITMQ_PORT", 5672)
+NOTIFICATIONS_RABBITMQ_PORT = env_int("RABBITMQ_PORT", 5672)
 NOTIFICATIONS_RABBITMQ_USERNAME = os.environ.get("RABBITMQ_USERNAME", "guest")
 NOTIFICATIONS_RABBITMQ_PASSWORD = os.environ.get("RABBITMQ_PASSWORD", "guest")
 NOTIFICATIONS_RABBITMQ_PATH = os.environ.get("RABBITMQ_PATH", "/")
@@ -104,7 +151,7 @@ generated for the account. See https://support.google.com/accounts/answer/185201
 for more details on how to generate an app password.
 """
 NOTIFICATIONS_SMTP_SERVER = os.environ.get("SMTP_SERVER", "smtp.example.com")
-NOTIFICATIONS_SMTP_PORT = os.environ.get("SMTP_PORT", 587)
+NOTIFICATIONS_SMTP_PORT = env_int("SMTP_PORT", 587)
 NOTIFICATIONS_SMTP_USERNAME = os.environ.get("SMTP_USERNAME", "username@example.com")
 NOTIFICATIONS_SMTP_PASSWORD = os.environ.get("SMTP_PASSWORD", "api_token")
 
@@ -132,36 +179,84 @@ NOTIFICATIONS_SLACK_CHANNEL = os.environ.get("SLACK_CHANNEL", "channel_name")
 These parameters are used to connect to the SLURM scheduler via SSH. A private key is
 used to authenticate the connection. The `SSH_USERNAME` is the username used to connect
 to the SLURM scheduler, and the `SSH_HOSTNAME` is the hostname of the SLURM scheduler.
+The private key at `SSH_PRIVATE_KEY_PATH` is loaded when the first SSH connection is made.
 """
 SSH_USERNAME = os.environ.get("SSH_USERNAME", "areynolds")
 SSH_HOSTNAME = os.environ.get("SSH_HOSTNAME", "login.altius.org")
 SSH_PRIVATE_KEY_PATH = os.environ.get("SSH_PRIVATE_KEY_PATH", os.path.expanduser(f"/Users/{SSH_USERNAME}/.ssh/id_ed25519"))
-try:
-    SSH_PRIVATE_KEY = paramiko.Ed25519Key.from_private_key_file(SSH_PRIVATE_KEY_PATH)
-except FileNotFoundError as err:
-    print(f" * SSH key not found: {err}", file=sys.stderr)
-    SSH_PRIVATE_KEY = None
+
+"""
+The SSH connection to the SLURM scheduler is kept open and reused between commands. A
+keepalive packet is sent every `SSH_KEEPALIVE_INTERVAL` seconds so that idle connections
+are not dropped by intermediate firewalls.
+"""
+SSH_KEEPALIVE_INTERVAL = env_int("SSH_KEEPALIVE_INTERVAL", 30)  # in seconds
 
 """
 Mongodb connection
 """
 MONGODB_URI = os.getenv("MONGODB_URI", "mongodb://localhost:27017")
 MONGODB_MONITOR_DB = os.getenv("MONGODB_MONITOR_DB", "monitordb")
-MONGODB_TIMEOUT = os.getenv("MONGODB_TIMEOUT", 1000)  # in milliseconds
+MONGODB_TIMEOUT = env_int("MONGODB_TIMEOUT", 1000)  # in milliseconds
 MONGODB_MONITOR_JOBS_COLLECTION = os.getenv("MONGODB_MONITOR_JOBS_COLLECTION", "jobs")
 
+"""
+Mongodb connection pool sizing, per application process
+"""
+MONGODB_MAX_POOL_SIZE = env_int("MONGODB_MAX_POOL_SIZE", 50)
+MONGODB_MIN_POOL_SIZE = env_int("MONGODB_MIN_POOL_SIZE", 5)
+
+"""
+Time to wait for a response on an open MongoDB connection before the operation fails,
+so that a stalled server does not hold a pooled connection (and a polling run)
+indefinitely. Set to 0 to wait without limit.
+"""
+MONGODB_SOCKET_TIMEOUT = env_int("MONGODB_SOCKET_TIMEOUT", 10000)  # in milliseconds
+
+"""
+Comma-separated list of wire protocol compressors to negotiate with MongoDB (e.g.,
+"zstd,snappy,zlib"), in order of preference. By default, the monitor database is
+on the same host and messages are not compressed. The "zstd" and "snappy"
+compressors need the `zstandard` and `python-snappy` packages, respectively.
+"""
+MONGODB_COMPRESSORS = os.getenv("MONGODB_COMPRESSORS", "")
+
 """
 When searching for jobs in the MongoDB monitor collection, this is as far back
 as we go to look for jobs that were created. This is to prevent the monitor from
 searching through too many jobs that were created a long time ago, which may no 
 longer be relevant.
 """
-MONGODB_MONITOR_JOB_CREATED_AT_MAX_AGE = os.environ.get("MONGODB_MONITOR_JOB_CREATED_AT_MAX_AGE", 60 * 60 * 24 * 14) # 14 days in seconds
+MONGODB_MONITOR_JOB_CREATED_AT_MAX_AGE = env_int("MONGODB_MONITOR_JOB_CREATED_AT_MAX_AGE", 60 * 60 * 24 * 14) # 14 days in seconds
+
+"""
+If set to a positive number of seconds, MongoDB removes jobs from the monitor
+collection this long after they were created, via a TTL index on `created_at`.
+Expired jobs can no longer be looked up or deleted via the monitor endpoints, so
+this is disabled (0) by default. Expiry is done by a background MongoDB task, so
+polling still applies `MONGODB_MONITOR_JOB_CREATED_AT_MAX_AGE` as a cutoff.
+A changed value is applied to the existing index at startup, via `collMod`. Setting
+it back to 0 does not drop the index; drop the `created_at_1` index manually.
+"""
+MONGODB_MONITOR_JOB_EXPIRE_AFTER = env_int("MONGODB_MONITOR_JOB_EXPIRE_AFTER", 0) # in seconds
+
+"""
+Number of jobs fetched from the MongoDB monitor collection per batch, when reading
+the unfinished jobs to poll, so that they are read with few round-trips.
+"""
+MONGODB_MONITOR_JOBS_BATCH_SIZE = env_int("MONGODB_MONITOR_JOBS_BATCH_SIZE", 500)
 
 """
 How frequently to poll the SLURM scheduler for job status updates.
 """
-MONITOR_POLLING_INTERVAL = os.environ.get("MONITOR_POLLING_INTERVAL", 1)  # in minutes
+MONITOR_POLLING_INTERVAL = env_int("MONITOR_POLLING_INTERVAL", 1)  # in minutes
+
+"""
+Where job status must be queried one job at a time (e.g., via the SLURM REST API), up
+to `MONITOR_POLLING_CONCURRENCY` queries are made concurrently on each poll. This is
+bounded, to limit the load on the SLURM controller.
+"""
+MONITOR_POLLING_CONCURRENCY = env_int("MONITOR_POLLING_CONCURRENCY", 8)
 
 """
 SLURM test parameters
@@ -181,104 +276,36 @@ SLURM_TEST_JOB_STATUS = {
 }
 
 """
-These parameters are used to define the SLURM job status codes and their explanations.
+These parameters are used to define the SLURM job status codes and their explanations,
+as read-only (code, explanation) tuples keyed by SLURM job state.
 """
-SLURM_STATE = {
-    "COMPLETED": {
-        "code": "CD",
-        "explanation": "The job has completed successfully.",
-    },
-    "COMPLETING": {
-        "code": "CG",
-        "explanation": "The job is finishing but some processes are still active.",
-    },
-    "FAILED": {
-        "code": "F",
-        "explanation": "The job terminated with a non-zero exit code and failed to execute.",
-    },
-    "PENDING": {
-        "code": "PD",
-        "explanation": "The job is waiting for resource allocation. It will eventually run.",
-    },
-    "PREEMPTED": {
-        "code": "PR",
-        "explanation": "The job was terminated because of preemption by another job.",
-    },
-    "RUNNING": {
-        "code": "R",
-        "explanation": "The job currently is allocated to a node and is running.",
-    },
-    "SUSPENDED": {
-        "code": "S",
-        "explanation": "A running job has been stopped with its cores released to other jobs.",
-    },
-    "STOPPED": {
-        "code": "ST",
-        "explanation": "A running job has been stopped with its cores retained.",
-    },
-    "TIMEOUT": {
-        "code": "TO",
-        "explanation": "The job has been terminated because it exceeded its time limit.",
-    },
-    "CANCELLED": {
-        "code": "CA",
-        "explanation": "The job has been cancelled by the user.",
-    },
-    "NODE_FAIL": {
-        "code": "NF",
-        "explanation": "The job has been terminated because one or more nodes failed.",
-    },
-    "BOOT_FAIL": {
-        "code": "BF",
-        "explanation": "The job has been terminated because the node failed to boot.",
-    },
-    "OUT_OF_MEMORY": {
-        "code": "OOM",
-        "explanation": "The job has been terminated because it exceeded its memory limit.",
-    },
-    "PREEMPTED": {
-        "code": "PR",
-        "explanation": "The job has been terminated because it was preempted by another job.",
-    },
-    "RESV_DEL_HOLD": {
-        "code": "RD",
-        "explanation": "The job has been held.",
-    },
-    "REQUEUE_FED": {
-        "code": "RF",
-        "explanation": "The job has been requeued by a federation.",
-    },
-    "REQUEUE_HOLD": {
-        "code": "RH",
-        "explanation": "Held job is being requeued.",
-    },
-    "RESIZING": {
-        "code": "RS",
-        "explanation": "The job is being resized.",
-    },
-    "REVOKED": {
-        "code": "RV",
-        "explanation": "Sibling was removed from cluster due to other cluster starting the job.",
-    },
-    "SIGNALING": {
-        "code": "SI",
-        "explanation": "The job is being signaled.",
-    },
-    "SPECIAL_EXIT": {
-        "code": "SE",
-        "explanation": "The job was requeued in a special state. This state can be set by users, typically in EpilogSlurmctld, if the job has terminated with a particular exit value.",
-    },
-    "STAGE_OUT": {
-        "code": "SO",
-        "explanation": "The job is being staged out.",
-    },
-    "DEADLINE": {
-        "code": "DL",
-        "explanation": "The job has been terminated because it exceeded its deadline.",
-    },
-}
+SLURM_STATE = MappingProxyType({
+    "COMPLETED": ("CD", "The job has completed successfully."),
+    "COMPLETING": ("CG", "The job is finishing but some processes are still active."),
+    "FAILED": ("F", "The job terminated with a non-zero exit code and failed to execute."),
+    "PENDING": ("PD", "The job is waiting for resource allocation. It will eventually run."),
+    "RUNNING": ("R", "The job currently is allocated to a node and is running."),
+    "SUSPENDED": ("S", "A running job has been stopped with its cores released to other jobs."),
+    "STOPPED": ("ST", "A running job has been stopped with its cores retained."),
+    "TIMEOUT": ("TO", "The job has been terminated because it exceeded its time limit."),
+    "CANCELLED": ("CA", "The job has been cancelled by the user."),
+    "NODE_FAIL": ("NF", "The job has been terminated because one or more nodes failed."),
+    "BOOT_FAIL": ("BF", "The job has been terminated because the node failed to boot."),
+    "OUT_OF_MEMORY": ("OOM", "The job has been terminated because it exceeded its memory limit."),
+    "PREEMPTED": ("PR", "The job has been terminated because it was preempted by another job."),
+    "RESV_DEL_HOLD": ("RD", "The job has been held."),
+    "REQUEUE_FED": ("RF", "The job has been requeued by a federation."),
+    "REQUEUE_HOLD": ("RH", "Held job is being requeued."),
+    "RESIZING": ("RS", "The job is being resized."),
+    "REVOKED": ("RV", "Sibling was removed from cluster due to other cluster starting the job."),
+    "SIGNALING": ("SI", "The job is being signaled."),
+    "SPECIAL_EXIT": ("SE", "The job was requeued in a special state. This state can be set by users, typically in EpilogSlurmctld, if the job has terminated with a particular exit value."),
+    "STAGE_OUT": ("SO", "The job is being staged out."),
+    "DEADLINE": ("DL", "The job has been terminated because it exceeded its deadline."),
+})
+SLURM_STATES_ALLOWED = frozenset(SLURM_STATE)
 SLURM_STATE_UNKNOWN = "UNKNOWN"
-SLURM_STATE_END_STATES = ["COMPLETED", "FAILED", "CANCELLED", "SUSPENDED", "NODE_FAIL", "TIMEOUT", "DEADLINE"]
+SLURM_STATE_END_STATES = frozenset(["COMPLETED", "FAILED", "CANCELLED", "SUSPENDED", "NODE_FAIL", "TIMEOUT", "DEADLINE"])
 
 """
 SLURM REST API parameters
@@ -289,9 +316,47 @@ SLURM_REST_API_DATA_PARSER_PLUGIN_VERSION = os.environ.get("SLURM_REST_API_DATA_
 SLURM_REST_HOST = os.environ.get("SLURM_REST_HOST", "https://slurmapi.altius.org")
 SLURM_REST_SLURM_ENDPOINT_URL = os.environ.get("SLURM_REST_URL", f"{SLURM_REST_HOST}/slurm/v{SLURM_REST_API_DATA_PARSER_PLUGIN_VERSION}")
 SLURM_REST_SLURMDB_ENDPOINT_URL = os.environ.get("SLURM_REST_URL", f"{SLURM_REST_HOST}/slurmdb/v{SLURM_REST_API_DATA_PARSER_PLUGIN_VERSION}")
-SLURM_REST_JWT_EXPIRATION_TIME = int(os.environ.get("SLURM_REST_JWT_EXPIRATION_TIME", 10))
+SLURM_REST_JWT_EXPIRATION_TIME = env_int("SLURM_REST_JWT_EXPIRATION_TIME", 10)
 SLURM_REST_GENERIC_USERNAME = "generic"
 
+"""
+SLURM REST API JWT tokens are reused for the same username until they are within
+this many seconds of their expiration time (SLURM_REST_JWT_EXPIRATION_TIME).
+"""
+SLURM_REST_JWT_EXPIRATION_SKEW = env_int("SLURM_REST_JWT_EXPIRATION_SKEW", 2)
+
+"""
+SLURM REST API connection pool sizing, per application process. Connections to the
+SLURM REST API host are kept alive and reused between requests.
+"""
+SLURM_REST_POOL_CONNECTIONS = env_int("SLURM_REST_POOL_CONNECTIONS", 10)
+SLURM_REST_POOL_MAXSIZE = env_int("SLURM_REST_POOL_MAXSIZE", 50)
+
+"""
+SLURM REST API requests time out if a connection cannot be made, or no data is
+received, within these many seconds. Idempotent requests (e.g., GET) that fail to
+connect, or that get a 502, 503 or 504 response, are retried up to
+SLURM_REST_MAX_RETRIES times, with a short exponential backoff. Job submissions
+(POST) are not retried.
+"""
+SLURM_REST_CONNECT_TIMEOUT = env_int("SLURM_REST_CONNECT_TIMEOUT", 5)  # in seconds
+SLURM_REST_READ_TIMEOUT = env_int("SLURM_REST_READ_TIMEOUT", 30)  # in seconds
+SLURM_REST_MAX_RETRIES = env_int("SLURM_REST_MAX_RETRIES", 3)
+
+"""
+SLURM job status retrieved one job at a time via the SLURM REST API is cached for this
+many seconds, per application process, so that repeated requests for the same job in
+quick succession are answered without querying the SLURM REST API again. Set to 0 to
+disable. At most SLURM_REST_JOB_STATUS_CACHE_MAXSIZE jobs are cached.
+
+If the SLURM REST API cannot be queried for a job, its cached status is used for up to
+SLURM_REST_JOB_STATUS_CACHE_STALE_TTL seconds after it has expired. Set to 0 to
+disable.
+"""
+SLURM_REST_JOB_STATUS_CACHE_TTL = env_int("SLURM_REST_JOB_STATUS_CACHE_TTL", 2)  # in seconds
+SLURM_REST_JOB_STATUS_CACHE_MAXSIZE = env_int("SLURM_REST_JOB_STATUS_CACHE_MAXSIZE", 4096)
+SLURM_REST_JOB_STATUS_CACHE_STALE_TTL = env_int("SLURM_REST_JOB_STATUS_CACHE_STALE_TTL", 30)  # in seconds
+
 """
 SLURM job submission methods
 """
@@ -1,30 +1,43 @@
 # -*- coding: utf-8 -*-
 
 import sys
+import orjson
+import functools
+import bson
 import pymongo
+from collections.abc import Iterator
+from datetime import (
+    datetime,
+    timezone,
+    timedelta,
+)
 from flask import (
     Response,
-    json,
+    has_request_context,
+    request,
     stream_with_context,
 )
 from app.constants import (
     MONGODB_URI,
     MONGODB_MONITOR_JOB_CREATED_AT_MAX_AGE,
+    MONGODB_MONITOR_JOB_EXPIRE_AFTER,
 )
 from app.task_mongodb_client import MongoDBConnection
 from bson import json_util
 
 mongodb_connection = MongoDBConnection()
 
+# MongoDB error code for an index that exists with different options
+MONGODB_INDEX_OPTIONS_CONFLICT = 85
+
 
 def get_current_datetime():
     """
-    Get the current date and time in ISO format.
+    Get the current date and time, in UTC.
     
     Returns:
-        str: The current date and time in ISO format.
+        datetime: The current date and time, in UTC.
     """
-    from datetime import (datetime, timezone)
     return datetime.now(timezone.utc)
 
 
@@ -38,13 +51,16 @@ def get_current_datetime_minus_interval(interval:int=MONGODB_MONITOR_JOB_CREATED
     Returns:
         datetime: The current date and time minus the specified interval.
     """
-    from datetime import (datetime, timezone, timedelta)
     return datetime.now(timezone.utc) - timedelta(seconds=interval)
 
 
+@functools.lru_cache(maxsize=1)
 def get_slurm_proxy_app():
     """
     Get the SLURM proxy application singleton instance. Useful for logging.
+
+    The instance is looked up once and cached, as this is called on most logging
+    paths (e.g., on each poll of the SLURM scheduler).
     """
     from app import slurm_proxy_app
     slurm_proxy_app_singleton = slurm_proxy_app.SlurmProxyApp.app()
@@ -52,22 +68,30 @@ def get_slurm_proxy_app():
 
 
 def ping_mongodb_client(
-    client: pymongo.MongoClient = mongodb_connection.get_client(),
+    client: pymongo.MongoClient = None,
     uri: str = MONGODB_URI,
 ) -> None:
     """
     Ping the MongoDB client to check if it is connected.
     This function attempts to ping the MongoDB client and raises an exception
-    if the connection fails.
+    if the connection fails. A warning is logged if PyMongo is running without its
+    C extensions, as BSON encoding and decoding then fall back to pure Python.
 
     Args:
-        client (pymongo.MongoClient): The MongoDB client to be pinged.
+        client (pymongo.MongoClient): The MongoDB client to be pinged. Defaults to
+            the client of the MongoDB connection singleton.
         uri (str): The URI used to connect to the MongoDB client.
 
     Raises:
         Exception: If the MongoDB client cannot be pinged.
     """
     app = get_slurm_proxy_app()
+    if not (bson.has_c() and pymongo.has_c()):
+        app.logger.warning(
+            "ping_mongodb_client | PyMongo C extensions are not available; BSON is encoded and decoded in pure Python"
+        )
+    if client is None:
+        client = mongodb_connection.get_client()
     try:
         client.admin.command("ping")
         app.logger.info(f"MongoDB running on {uri}")
@@ -78,10 +102,189 @@ def ping_mongodb_client(
         sys.exit(-1)
 
 
-def stream_json_response(data: dict, status_code: int = 200) -> Response:
+def create_mongodb_indexes() -> bool:
+    """
+    Create the indexes used by monitor database queries, if they do not already exist.
+
+    Returns:
+        bool: True if the unique indexes exist, False otherwise.
+    """
+    app = get_slurm_proxy_app()
+    try:
+        jobs_coll = mongodb_connection.get_monitor_jobs_collection()
+    except pymongo.errors.PyMongoError as err:
+        app.logger.error(
+            f"create_mongodb_indexes | Failed to get monitor database collection: {err}"
+        )
+        return False
+    result = True
+    indexes = [
+        ([("slurm_job_id", pymongo.ASCENDING)], {"unique": True}),
+        ([("task.uuid", pymongo.ASCENDING)], {"unique": True}),
+        ([("slurm_job_state", pymongo.ASCENDING), ("created_at", pymongo.ASCENDING)], {}),
+    ]
+    if MONGODB_MONITOR_JOB_EXPIRE_AFTER > 0:
+        indexes.append(
+            ([("created_at", pymongo.ASCENDING)], {"expireAfterSeconds": MONGODB_MONITOR_JOB_EXPIRE_AFTER})
+        )
+    for keys, options in indexes:
+        try:
+            try:
+                jobs_coll.create_index(keys, **options)
+            except pymongo.errors.OperationFailure as err:
+                # an existing TTL index is updated in place if its expiry has changed
+                if err.code != MONGODB_INDEX_OPTIONS_CONFLICT or "expireAfterSeconds" not in options:
+                    raise
+                jobs_coll.database.command(
+                    "collMod",
+                    jobs_coll.name,
+                    index={"keyPattern": dict(keys), "expireAfterSeconds": options["expireAfterSeconds"]},
+                )
+                app.logger.info(
+                    f"create_mongodb_indexes | Updated monitor database index {keys} to expire after {options['expireAfterSeconds']} seconds"
+                )
+        except pymongo.errors.PyMongoError as err:
+            if options.get("unique"):
+                app.logger.error(
+                    f"create_mongodb_indexes | Failed to create unique monitor database index {keys}: {err}"
+                )
+                result = False
+            else:
+                app.logger.warning(
+                    f"create_mongodb_indexes | Failed to create monitor database index {keys}: {err}"
+                )
+    return result
+
+
+class JSONResponse(Response):
+    """
+    Flask Response with `application/json` as its default mimetype.
+    """
+    default_mimetype = "application/json"
+
+
+@functools.lru_cache(maxsize=1)
+def get_json_default_encoders() -> dict:
+    """
+    Get the serializers used by `json_default`, keyed by type. The job summary
+    classes are imported on first use, as they depend on this module.
+
+    Returns:
+        dict: Serializer functions, keyed by the type of object they serialize.
+    """
+    from app.task_metadata_job_summary import JobSummary
+    from app.task_metadata_slurm_job_summary import SlurmJobSummary
+    from app.task_metadata_monitor_job_summary import MonitorJobSummary
+    return {
+        JobSummary: JobSummary.to_dict,
+        SlurmJobSummary: SlurmJobSummary.to_dict,
+        MonitorJobSummary: MonitorJobSummary.to_dict,
+    }
+
+
+def json_default(obj):
+    """
+    Serialize objects that orjson does not support natively: job summary objects
+    are serialized via their `to_dict` method, looked up by type, and BSON types
+    (e.g., ObjectId) and datetimes via their MongoDB extended JSON representation
+    (e.g., `{"$date": ...}`), as datetimes are passed through to this function
+    with `orjson.OPT_PASSTHROUGH_DATETIME`.
+
+    Args:
+        obj: The object to be serialized.
+
+    Returns:
+        A JSON-serializable representation of the object.
+
+    Raises:
+        TypeError: If the object cannot be serialized.
+    """
+    encoder = get_json_default_encoders().get(type(obj))
+    if encoder:
+        return encoder(obj)
+    return json_util.default(obj)
+
+
+def is_pretty_json_requested() -> bool:
+    """
+    Test if the current request asks for indented JSON output, via the `pretty`
+    query parameter (e.g., `?pretty` or `?pretty=true`).
+
+    Returns:
+        bool: True if indented JSON output was requested, False otherwise.
+    """
+    if not has_request_context():
+        return False
+    return request.args.get("pretty", "false").lower() in ("", "1", "true", "yes")
+
+
+def is_bson_requested() -> bool:
+    """
+    Test if the current request prefers a BSON response over JSON, via its
+    `Accept` header (i.e., `application/bson`).
+
+    Returns:
+        bool: True if a BSON response was requested, False otherwise.
+    """
+    if not has_request_context():
+        return False
+    best_match = request.accept_mimetypes.best_match(
+        ["application/json", "application/bson"], default="application/json"
+    )
+    return best_match == "application/bson"
+
+
+def raw_bson_response(document, status_code: int = 200) -> Response:
+    """
+    Send a MongoDB document as a BSON response, as is, without decoding and
+    re-encoding it in Python.
+
+    Args:
+        document (RawBSONDocument): The document, as read from MongoDB.
+        status_code (int): The HTTP status code for the response.
+
+    Returns:
+        Response: A Flask Response object with the BSON data.
+    """
+    return Response(document.raw, mimetype="application/bson", status=status_code)
+
+
+def json_response(data, status_code: int = 200) -> Response:
+    """
+    Send a JSON response with the given data and status code.
+
+    The data is serialized once into the response body, rather than streamed, as
+    most responses (e.g., job summaries) are small.
+
+    JSON is serialized compactly, unless indented output is requested with the
+    `pretty` query parameter.
+
+    Args:
+        data (dict): The data to be included in the JSON response.
+        status_code (int): The HTTP status code for the response.
+
+    Returns:
+        Response: A Flask Response object with the JSON data.
+    """
+    option = orjson.OPT_PASSTHROUGH_DATETIME
+    if is_pretty_json_requested():
+        option |= orjson.OPT_INDENT_2
+    body = orjson.dumps(data, default=json_default, option=option | orjson.OPT_APPEND_NEWLINE)
+    return JSONResponse(body, status=status_code)
+
+
+def stream_json_response(data, status_code: int = 200) -> Response:
     """
     Stream a JSON response with the given data and status code.
 
+    If the data is a list or other iterable of records (e.g., a generator), each
+    record is serialized and sent as it becomes available, so that the response
+    can start draining before all records are serialized. Other data is sent as
+    a single body, via `json_response`.
+
+    JSON is serialized compactly, unless indented output is requested with the
+    `pretty` query parameter.
+
     Args:
         data (dict): The data to be included in the JSON response.
         status_code (int): The HTTP status code for the response.
@@ -89,27 +292,42 @@ def stream_json_response(data: dict, status_code: int = 200) -> Response:
     Returns:
         Response: A Flask Response object with the streamed JSON data.
     """
+    if not isinstance(data, (list, tuple, Iterator)):
+        return json_response(data, status_code)
+
+    option = orjson.OPT_PASSTHROUGH_DATETIME
+    if is_pretty_json_requested():
+        option |= orjson.OPT_INDENT_2
 
-    def generate():
-        yield json_util.dumps(data, indent=4, default=vars)
-        yield "\n"
+    def generate_records():
+        yield b"["
+        for i, record in enumerate(data):
+            if i > 0:
+                yield b","
+            yield orjson.dumps(record, default=json_default, option=option)
+        yield b"]\n"
 
-    response = Response(
-        stream_with_context(generate()),
-        mimetype="application/json",
+    return JSONResponse(
+        stream_with_context(generate_records()),
         status=status_code,
+        direct_passthrough=True,
     )
-    response.headers["Content-Type"] = "application/json"
-    return response
 
 
 def get_dict_from_streamed_json_response(response_as_json: Response) -> dict:
-    res = ""
-    while True:
-        try:
-            res += next(response_as_json.response)
-            # print(f'res: {res}')
-        except StopIteration:
-            break
-    res = json.loads(res)
-    return res
+    """
+    Read a JSON response, streamed or not, back into Python objects.
+
+    The response chunks are collected and joined once, and parsed with orjson.
+
+    Args:
+        response_as_json (Response): A Flask Response object with streamed JSON data.
+
+    Returns:
+        dict: The parsed JSON data.
+    """
+    chunks = [
+        chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+        for chunk in response_as_json.response
+    ]
+    return orjson.loads(b"".join(chunks))
@@ -1,15 +1,22 @@
 import os
+import queue
+import atexit
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from flask import Flask
 from dotenv import load_dotenv
 from logging.config import dictConfig
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.executors.pool import ThreadPoolExecutor
 
 from app import constants
 from app.task_submission import task_submission
 from app.task_monitoring import task_monitoring, poll_slurm_jobs
 from app.task_slurm_rest import task_slurm_rest
-from app.helpers import ping_mongodb_client
+from app.helpers import (
+    ping_mongodb_client,
+    create_mongodb_indexes,
+)
 
 '''
 This module defines the SlurmProxyApp class, which is a singleton Flask application
@@ -17,6 +24,12 @@ This module defines the SlurmProxyApp class, which is a singleton Flask applicat
 
 class SlurmProxyApp(Flask):
     _app = None
+    _log_listener = None
+    _log_listener_running = False
+    _log_listener_paused = False
+    _log_queue_handler = None
+    _log_handlers = []
+    _log_queue_initialized = False
 
     def __init__(self):
         raise Error('call SlurmProxyApp()')
@@ -38,6 +51,7 @@ class SlurmProxyApp(Flask):
 
             cls._app.config.from_object("app.config.Config")
             logging.config.dictConfig(cls._app.config["LOGGING_CONFIG"])
+            cls.init_log_queue()
             logging.getLogger("apscheduler").setLevel(logging.WARNING)
 
             cls._app.register_blueprint(task_submission, url_prefix="/submit")
@@ -49,15 +63,29 @@ class SlurmProxyApp(Flask):
                 cls._app.logger.info(f"ping > pong")
                 return "pong"
 
+            if cls.is_reloader_watcher_process():
+                cls._app.logger.info("Reloader watcher process started; scheduler not initialized")
+                return cls._app
+
             with cls._app.app_context():
                 ping_mongodb_client()
-                scheduler = BackgroundScheduler()
+                if not create_mongodb_indexes():
+                    cls._app.logger.error(
+                        "Monitor database unique indexes are missing; duplicate jobs may be monitored"
+                    )
+                # the polling task is the only scheduled job, and never runs
+                # concurrently with itself (max_instances=1), so one worker
+                # thread is enough; concurrent SLURM queries are made within it
+                scheduler = BackgroundScheduler(
+                    executors={"default": ThreadPoolExecutor(max_workers=1)},
+                )
                 poll_scheduler = scheduler.add_job(
                     poll_slurm_jobs,
                     "interval",
-                    minutes=int(constants.MONITOR_POLLING_INTERVAL),
+                    minutes=constants.MONITOR_POLLING_INTERVAL,
                     id="poll_slurm_jobs",
                     replace_existing=True,
+                    coalesce=True,
                     max_instances=1,
                     misfire_grace_time=60,
                 )
@@ -66,4 +94,87 @@ class SlurmProxyApp(Flask):
 
         return cls._app
 
-app = SlurmProxyApp.app()
\ No newline at end of file
+    @staticmethod
+    def is_reloader_watcher_process() -> bool:
+        """
+        Test if this is the watcher process of the Werkzeug reloader, which only
+        restarts the server process on code changes. The server process that it
+        starts is marked by Werkzeug with `WERKZEUG_RUN_MAIN`.
+
+        Returns:
+            bool: True if this is the reloader watcher process, False otherwise.
+        """
+        return (
+            os.environ.get(constants.APP_RELOADER_ENV) == "true"
+            and os.environ.get("WERKZEUG_RUN_MAIN") != "true"
+        )
+
+    @classmethod
+    def init_log_queue(cls):
+        """
+        Route log records through a queue, to be written to the configured root
+        handlers by a background listener thread, which is restarted across forks.
+        """
+        if cls._log_queue_initialized:
+            return
+        root_logger = logging.getLogger()
+        handlers = root_logger.handlers[:]
+        if not handlers:
+            return
+        for handler in handlers:
+            root_logger.removeHandler(handler)
+        cls._log_queue_handler = QueueHandler(queue.SimpleQueue())
+        root_logger.addHandler(cls._log_queue_handler)
+        cls._log_handlers = handlers
+        cls.start_log_listener()
+        # the listener is stopped before a fork, which drains the queue, so that
+        # no records are pending when the child replaces it with its own queue
+        os.register_at_fork(
+            before=cls.pause_log_listener,
+            after_in_parent=cls.resume_log_listener,
+            after_in_child=cls.start_log_listener,
+        )
+        atexit.register(cls.stop_log_listener)
+        cls._log_queue_initialized = True
+
+    @classmethod
+    def start_log_listener(cls):
+        """
+        Start a log listener thread, on a new queue.
+        """
+        cls._log_queue_handler.queue = queue.SimpleQueue()
+        cls._log_listener = QueueListener(
+            cls._log_queue_handler.queue, *cls._log_handlers, respect_handler_level=True
+        )
+        cls._log_listener.start()
+        cls._log_listener_running = True
+        cls._log_listener_paused = False
+
+    @classmethod
+    def stop_log_listener(cls):
+        """
+        Stop the log listener thread, once it has written all queued records.
+        """
+        if cls._log_listener_running:
+            cls._log_listener.stop()
+            cls._log_listener_running = False
+
+    @classmethod
+    def pause_log_listener(cls):
+        """
+        Stop the log listener thread before a fork, so that it can be resumed after.
+        """
+        cls._log_listener_paused = cls._log_listener_running
+        cls.stop_log_listener()
+
+    @classmethod
+    def resume_log_listener(cls):
+        """
+        Restart the log listener thread after a fork, on the same queue.
+        """
+        if cls._log_listener_paused:
+            cls._log_listener.start()
+            cls._log_listener_running = True
+            cls._log_listener_paused = False
+
+app = SlurmProxyApp.app()
@@ -5,6 +5,8 @@ from app.task_metadata_monitor_job_summary import MonitorJobSummary
 
 class JobSummary(object):
 
+    __slots__ = ("slurm", "monitor")
+
     def __init__(self, slurm_summary: SlurmJobSummary, monitor_summary: MonitorJobSummary) -> None:
         """
         Initialize a JobSummary instance with Slurm and Monitor summary metadata.
@@ -21,12 +23,15 @@ class JobSummary(object):
         """
         Convert the JobSummary instance to a dictionary representation.
 
+        The Slurm and Monitor metadata may be summary objects, or dictionaries
+        (e.g., a monitor database document), which are used as they are.
+
         Returns:
             dict: Dictionary representation of the job.
         """
         return {
-            "slurm": self.slurm.to_dict(),
-            "monitor": self.monitor.to_dict(),
+            "slurm": self.slurm if isinstance(self.slurm, dict) else self.slurm.to_dict(),
+            "monitor": self.monitor if isinstance(self.monitor, dict) else self.monitor.to_dict(),
         }
     
     def __repr__(self) -> str:
@@ -12,6 +12,15 @@ class MonitorJobSummary(object):
     other relevant information where it differs from the Slurm scheduler.
     '''
 
+    __slots__ = (
+        "slurm_username",
+        "slurm_job_id",
+        "slurm_job_state",
+        "task",
+        "created_at",
+        "updated_at",
+    )
+
     def __init__(self, slurm_username:str, slurm_job_id:int, slurm_job_state:str, task:dict) -> None:
         self.slurm_username = slurm_username
         self.slurm_job_id = slurm_job_id
@@ -107,7 +116,7 @@ class MonitorJobSummary(object):
             "slurm_job_state": self.slurm_job_state,
             "task": self.task,
             "created_at": self.created_at,
-            "updated_at": self.updated_at if self.updated_at else None,
+            "updated_at": self.updated_at,
         }
     
     def __repr__(self) -> str:
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
 from app.constants import (
-  SLURM_STATE,
+  SLURM_STATES_ALLOWED,
   SLURM_REST_GENERIC_USERNAME,
 )
 
@@ -10,6 +10,8 @@ class SlurmJobSummary(object):
     Base class for metadata derived from querying the Slurm scheduler.
     '''
 
+    __slots__ = ("username", "job_id", "job_state")
+
     def __init__(self, username:str, job_id:int, job_state:str) -> None:
         self.username = username
         self.job_id = job_id
@@ -26,7 +28,7 @@ class SlurmJobSummary(object):
         Returns:
             T: The updated task job instance.
         """
-        if job_state in SLURM_STATE.keys():
+        if job_state in SLURM_STATES_ALLOWED:
             self.job_state = job_state
 
 
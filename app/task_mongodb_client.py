@@ -1,15 +1,27 @@
 # -*- coding: utf-8 -*-
 
+import os
 from pymongo import MongoClient
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
 from threading import Lock
 from app.constants import (
     MONGODB_URI,
     MONGODB_MONITOR_DB,
+    MONGODB_MONITOR_JOBS_COLLECTION,
     MONGODB_TIMEOUT,
+    MONGODB_MAX_POOL_SIZE,
+    MONGODB_MIN_POOL_SIZE,
+    MONGODB_SOCKET_TIMEOUT,
+    MONGODB_COMPRESSORS,
 )
 
 
 class MongoDBConnection:
+    '''
+    Process-wide MongoDB connection, whose client is recreated after a fork (e.g.,
+    into uWSGI workers), as PyMongo clients are not fork-safe.
+    '''
 
     _instance = None
     _lock = Lock()
@@ -19,26 +31,81 @@ class MongoDBConnection:
         uri=MONGODB_URI,
         database_name=MONGODB_MONITOR_DB,
         serverSelectionTimeoutMS=MONGODB_TIMEOUT,
+        maxPoolSize=MONGODB_MAX_POOL_SIZE,
+        minPoolSize=MONGODB_MIN_POOL_SIZE,
+        socketTimeoutMS=MONGODB_SOCKET_TIMEOUT,
+        compressors=MONGODB_COMPRESSORS,
         **kwargs
     ):
         if not cls._instance:
             with cls._lock:
                 if not cls._instance:
                     cls._instance = super(MongoDBConnection, cls).__new__(cls)
-                    cls._instance._client = MongoClient(
-                        uri, serverSelectionTimeoutMS=serverSelectionTimeoutMS, **kwargs
+                    cls._instance._uri = uri
+                    cls._instance._database_name = database_name
+                    cls._instance._client_kwargs = dict(
+                        serverSelectionTimeoutMS=int(serverSelectionTimeoutMS),
+                        maxPoolSize=int(maxPoolSize),
+                        minPoolSize=int(minPoolSize),
+                        socketTimeoutMS=int(socketTimeoutMS) or None,
+                        connect=False,
+                        tz_aware=True,
+                        **kwargs
                     )
-                    cls._instance._monitor_db = cls._instance._client[database_name]
+                    if compressors:
+                        cls._instance._client_kwargs["compressors"] = compressors
+                    cls._instance.init_client()
         return cls._instance
 
+    def init_client(self):
+        self._pid = os.getpid()
+        self._client = MongoClient(self._uri, **self._client_kwargs)
+        self._monitor_db = self._client[self._database_name]
+        self._monitor_jobs_collection = self._monitor_db[MONGODB_MONITOR_JOBS_COLLECTION]
+        self._monitor_jobs_raw_collection = self._monitor_jobs_collection.with_options(
+            codec_options=CodecOptions(document_class=RawBSONDocument)
+        )
+
+    def ensure_client_for_pid(self):
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self.init_client()
+
     def get_client(self):
+        self.ensure_client_for_pid()
         return self._client
 
     def get_monitor_db(self):
+        self.ensure_client_for_pid()
         return self._monitor_db
 
     def get_monitor_jobs_collection(self):
-        return self._monitor_db["jobs"]
+        self.ensure_client_for_pid()
+        return self._monitor_jobs_collection
+
+    def bulk_update_jobs(self, ops: list):
+        """
+        Apply a batch of write operations (e.g., `pymongo.UpdateOne`) to the monitor
+        jobs collection, in a single unordered bulk write, rather than with one
+        round-trip per job.
+
+        Args:
+            ops (list): The write operations to apply.
+
+        Returns:
+            pymongo.results.BulkWriteResult: The result of the bulk write.
+        """
+        return self.get_monitor_jobs_collection().bulk_write(ops, ordered=False)
+
+    def get_monitor_jobs_raw_collection(self):
+        """
+        Get the monitor jobs collection, returning documents as RawBSONDocument
+        objects, which keep the BSON bytes as received from the server rather than
+        decoding them into Python dictionaries.
+        """
+        self.ensure_client_for_pid()
+        return self._monitor_jobs_raw_collection
 
 
 mongodb_connection_singleton = MongoDBConnection()
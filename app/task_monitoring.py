@@ -1,16 +1,28 @@
 # -*- coding: utf-8 -*-
 
-import copy
+import io
+import os
+import csv
+import logging
+import time
+import shlex
 import pymongo
-import paramiko
+from threading import Lock, BoundedSemaphore
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from flask import (
     Blueprint,
     request,
     Response,
 )
 from app import helpers
+from app.helpers import (
+    get_slurm_proxy_app,
+    get_current_datetime,
+    get_current_datetime_minus_interval,
+)
 from app.constants import (
-    SLURM_STATE,
+    SLURM_STATES_ALLOWED,
     SLURM_STATE_UNKNOWN,
     SLURM_STATE_END_STATES,
     SLURM_TEST_JOB_ID,
@@ -19,6 +31,13 @@ from app.constants import (
     TASK_METADATA,
     SlurmCommunicationMethods,
     MONGODB_MONITOR_JOB_CREATED_AT_MAX_AGE,
+    MONGODB_MONITOR_JOBS_BATCH_SIZE,
+    MONITOR_POLLING_CONCURRENCY,
+    SLURM_REST_JOB_STATUS_CACHE_TTL,
+    SLURM_REST_JOB_STATUS_CACHE_MAXSIZE,
+    SLURM_REST_JOB_STATUS_CACHE_STALE_TTL,
+    NOTIFICATIONS_MAX_WORKERS,
+    NOTIFICATIONS_MAX_PENDING,
 )
 from app.task_notification import (
     NotificationMethod,
@@ -26,6 +45,10 @@ from app.task_notification import (
 )
 from app.task_ssh_client import ssh_client_connection_singleton
 from app.task_mongodb_client import mongodb_connection_singleton
+from app.task_slurm_rest import (
+    get_job_info_for_job_id_via_params,
+    get_jobs_info_for_username_via_params,
+)
 from app.task_metadata_monitor_job_summary import MonitorJobSummary
 from app.task_metadata_slurm_job_summary import SlurmJobSummary
 from app.task_metadata_job_summary import JobSummary
@@ -33,9 +56,98 @@ from app.task_metadata_job_summary import JobSummary
 ssh_connection = ssh_client_connection_singleton
 mongodb_connection = mongodb_connection_singleton
 
-SLURM_STATES_ALLOWED = SLURM_STATE.keys()
 SLURM_COMMUNICATION_METHOD = SlurmCommunicationMethods.REST
 
+'''
+Fields requested from `sacct`, and the keys they are parsed into, in order
+'''
+SACCT_JOB_STATUS_FORMAT = "--format=JobID,Jobname%-128,state,User,partition,time,start,end,elapsed"
+SACCT_JOB_STATUS_KEYS = (
+    "job_id",
+    "job_name",
+    "state",
+    "user",
+    "partition",
+    "time",
+    "start",
+    "end",
+    "elapsed",
+)
+
+'''
+Commands run on the SLURM scheduler via SSH. Values are substituted into these
+templates with `shlex.quote`.
+'''
+SCANCEL_JOB_ID_CMD = "scancel {slurm_job_id}"
+SACCT_JOB_ID_CMD = f"sacct -j {{slurm_job_id}} {SACCT_JOB_STATUS_FORMAT} --noheader --parsable2"
+SACCT_JOB_IDS_CMD = f"sacct -X -j {{slurm_job_ids}} {SACCT_JOB_STATUS_FORMAT} --noheader --parsable2"
+SACCT_JOB_STATE_CMD = f"sacct --state {{slurm_job_state}} {SACCT_JOB_STATUS_FORMAT} --noheader --parsable2"
+
+'''
+SLURM job status retrieved via the SLURM REST API, keyed by (job ID, username), as
+(SlurmJobSummary, expiry, stale expiry) tuples of time.monotonic() values
+'''
+slurm_rest_job_status_cache = {}
+slurm_rest_job_status_cache_lock = Lock()
+
+'''
+Notification methods, mapped to a name used in log messages and a function that
+returns the arguments of the method's `notify` callback from the notification
+parameters and message
+'''
+NOTIFICATION_DISPATCH = {
+    NotificationMethod.EMAIL.value: (
+        "email",
+        lambda params, msg: (
+            params["email"]["sender"],
+            params["email"]["recipient"],
+            params["email"]["subject"],
+            msg,
+        ),
+    ),
+    NotificationMethod.GMAIL.value: (
+        "Gmail",
+        lambda params, msg: (
+            params["gmail"]["sender"],
+            params["gmail"]["recipient"],
+            params["gmail"]["subject"],
+            msg,
+        ),
+    ),
+    NotificationMethod.SLACK.value: (
+        "Slack",
+        lambda params, msg: (msg, params["slack"]["channel"]),
+    ),
+    NotificationMethod.RABBITMQ.value: (
+        "RabbitMQ",
+        lambda params, msg: (
+            params["rabbitmq"]["queue"],
+            params["rabbitmq"]["exchange"],
+            params["rabbitmq"]["routing_key"],
+            msg,
+        ),
+    ),
+    NotificationMethod.TEST.value: (
+        "test",
+        lambda params, msg: (msg,),
+    ),
+}
+
+'''
+Notification callbacks, created once per notification method
+'''
+notification_callbacks = {}
+
+'''
+Thread pool used to send notification messages, created per process ID
+'''
+notification_executor_state = {
+    "pid": None,
+    "executor": None,
+    "pending": None,
+}
+notification_executor_lock = Lock()
+
 task_monitoring = Blueprint("task_monitoring", __name__)
 
 """
@@ -50,9 +162,6 @@ def post() -> Response:
     POST request to add a new job to the monitor database.
     The request body should contain a JSON object with the job information.
     """
-    from app.helpers import (
-        get_slurm_proxy_app,
-    )
     app = get_slurm_proxy_app()
     request_info = request.get_json(force=True)
     request_monitor_job = request_info.get("monitor", None)
@@ -66,9 +175,9 @@ def post() -> Response:
         task=request_monitor_job.get("task", {}),
     )
     response = (
-        helpers.stream_json_response(job, 200)
+        helpers.json_response(job, 200)
         if monitor_new_slurm_job(job)
-        else helpers.stream_json_response({"error": "Failed to monitor job"}, 400)
+        else helpers.json_response({"error": "Failed to monitor job"}, 400)
     )
     return response
 
@@ -87,9 +196,6 @@ def get_job_metadata_by_slurm_job_id(slurm_job_id: str) -> Response:
     Returns:
         Response: A Flask Response object containing the job metadata in JSON format.
     """
-    from app.helpers import (
-        get_slurm_proxy_app,
-    )
     app = get_slurm_proxy_app()
     slurm_username = request.args.get("username")
     if not slurm_username:
@@ -107,7 +213,7 @@ def get_job_metadata_by_slurm_job_id(slurm_job_id: str) -> Response:
         return {"error": "Job scheduler or monitor information not found"}, 404
     # package up a job summary object
     job_summary = JobSummary(slurm_summary=slurm_job_status_metadata, monitor_summary=monitor_db_job_metadata)
-    response = helpers.stream_json_response(job_summary, 200)
+    response = helpers.json_response(job_summary, 200)
     return response
 
 
@@ -123,9 +229,6 @@ def get_job_metadata_by_task_uuid(task_uuid: str) -> Response:
     Returns:
         Response: A Flask Response object containing the job metadata in JSON format.
     """
-    from app.helpers import (
-        get_slurm_proxy_app,
-    )
     app = get_slurm_proxy_app()
     if not task_uuid:
         app.logger.error("get_job_metadata_by_task_uuid | No task UUID provided")
@@ -150,7 +253,7 @@ def get_job_metadata_by_task_uuid(task_uuid: str) -> Response:
         )
         return {"error": "Job Slurm metadata not found"}, 404
     response_data = JobSummary(slurm_summary=slurm_job_status_metadata, monitor_summary=monitor_db_job_metadata)
-    response = helpers.stream_json_response(response_data, 200)
+    response = helpers.json_response(response_data, 200)
     return response
 
 
@@ -168,9 +271,6 @@ def get_by_slurm_job_state(slurm_job_state: str) -> Response:
     Returns:
         Response: A Flask Response object containing the job metadata in JSON format.
     """
-    from app.helpers import (
-        get_slurm_proxy_app,
-    )
     app = get_slurm_proxy_app()
     if slurm_job_state not in SLURM_STATES_ALLOWED:
         app.logger.error(
@@ -197,33 +297,26 @@ def delete_by_slurm_job_id_via_ssh(slurm_job_id: int) -> Response:
     Returns:
         Response: A Flask Response object indicating the success or failure of the operation.
     """
-    from app.helpers import (
-        get_slurm_proxy_app,
-    )
+    import paramiko
     app = get_slurm_proxy_app()
     response = None
     # check if job was already in the monitor database
     slurm_job_id = int(slurm_job_id)
-    job_metadata = get_job_metadata_from_monitor_db_by_query({'slurm_job_id': slurm_job_id})
+    job_metadata = get_job_metadata_from_monitor_db_by_query(
+        {'slurm_job_id': slurm_job_id},
+        {'slurm_job_id': 1},
+    )
     if job_metadata:
         try:
             # delete the job from SLURM queue
-            cmd = " ".join(
-                [
-                    str(x)
-                    for x in [
-                        "scancel",
-                        str(slurm_job_id),
-                    ]
-                ]
-            )
+            cmd = SCANCEL_JOB_ID_CMD.format(slurm_job_id=shlex.quote(str(slurm_job_id)))
             (stdin, stdout, stderr) = ssh_connection.ssh_client_exec(cmd)
             exit_code = stdout.channel.recv_exit_status()
             if exit_code != 0:
                 app.logger.error(
                     f'delete_by_slurm_job_id | Failed to delete job from SLURM: {stderr.read().decode("utf-8")}'
                 )
-                response = helpers.stream_json_response(
+                response = helpers.json_response(
                     {"error": "Job could not be deleted from SLURM scheduler"}, 400
                 )
                 return response
@@ -231,27 +324,41 @@ def delete_by_slurm_job_id_via_ssh(slurm_job_id: int) -> Response:
             app.logger.error(
                 f"delete_by_slurm_job_id | Failed to delete job from SLURM via SSH client: {err}"
             )
-            response = helpers.stream_json_response(
+            response = helpers.json_response(
                 {"error": f"Failed to delete job from SLURM: {err}"}, 500
             )
             return response
         except Exception as err:
             app.logger.error(f"delete_by_slurm_job_id | Unexpected error: {err}")
-            response = helpers.stream_json_response({"error": f"Unexpected error: {err}"}, 500)
+            response = helpers.json_response({"error": f"Unexpected error: {err}"}, 500)
             return response
     else:
         # job not found in the database
         app.logger.error(
             f"delete_by_slurm_job_id | Job {slurm_job_id} not found in monitor database"
         )
-        response = helpers.stream_json_response(
+        response = helpers.json_response(
             {"error": f"Job not found in monitor database"}, 404
         )
         return response
     # delete the job from the database
-    deleted_job = remove_and_return_job_from_monitor_db_by_slurm_job_id(slurm_job_id)
+    bson_requested = helpers.is_bson_requested()
+    deleted_job = remove_and_return_job_from_monitor_db_by_slurm_job_id(
+        slurm_job_id, raw=bson_requested
+    )
+    if not deleted_job:
+        # job was removed from the database after the lookup above
+        app.logger.error(
+            f"delete_by_slurm_job_id | Job {slurm_job_id} not found in monitor database"
+        )
+        response = helpers.json_response(
+            {"error": f"Job not found in monitor database"}, 404
+        )
+        return response
     # return the job object
-    response = helpers.stream_json_response(deleted_job, 200)
+    if bson_requested:
+        return helpers.raw_bson_response(deleted_job, 200)
+    response = helpers.json_response(deleted_job, 200)
     return response
 
 
@@ -271,9 +378,6 @@ def monitor_new_slurm_job(job: MonitorJobSummary) -> bool:
     Returns:
         bool: True if the job was successfully monitored, False otherwise.
     """
-    from app.helpers import (
-        get_slurm_proxy_app,
-    )
     app = get_slurm_proxy_app()
     try:
         slurm_job_id = job.get_slurm_job_id()
@@ -287,19 +391,23 @@ def monitor_new_slurm_job(job: MonitorJobSummary) -> bool:
     )
     if not slurm_job_status_metadata:
         return False
-    slurm_job_state = (
-        slurm_job_status_metadata.get_job_state()
-        if slurm_job_status_metadata
-        or slurm_job_status_metadata.get_job_state() in SLURM_STATE_END_STATES
-        else SLURM_STATE_UNKNOWN
-    )
+    slurm_job_state = slurm_job_status_metadata.get_job_state()
     slurm_job_task_metadata = job.get_task()
     result = add_job_to_monitor_db(
-        slurm_job_id, slurm_job_state, slurm_job_task_metadata, slurm_username
+        slurm_job_id,
+        slurm_job_state,
+        slurm_job_task_metadata,
+        slurm_username,
+        slurm_job_status_metadata=slurm_job_status_metadata,
     )
     # if the job is already completed, we send a notification msg
     if slurm_job_state in SLURM_STATE_END_STATES:
-        process_job_state_change(slurm_job_id, SLURM_STATE_UNKNOWN, slurm_job_state)
+        process_job_state_change(
+            slurm_job_id,
+            SLURM_STATE_UNKNOWN,
+            slurm_job_state,
+            task=slurm_job_task_metadata,
+        )
     return result
 
 
@@ -308,34 +416,36 @@ def add_job_to_monitor_db(
     slurm_job_state: str,
     slurm_job_task_metadata: dict,
     slurm_username: str,
+    slurm_job_status_metadata: SlurmJobSummary = None,
 ) -> bool:
     """
     Add a new job to the monitor database, only if its SLURM job ID and task
-    UUID are not already present in the database.
+    UUID are not already present in the database. This is enforced by the unique
+    indexes on these fields, so that the job is inserted in a single round-trip.
 
     The job dictionary should contain the SLURM job ID and task information.
-    The SLURM job status is retrieved from the SLURM scheduler.
+    If the SLURM job state is unknown, the SLURM job status is retrieved from the
+    SLURM scheduler, unless it has already been retrieved by the caller.
 
     Args:
         slurm_job_id (int): The SLURM job ID.
         slurm_job_state (str): The SLURM job state.
         slurm_job_task_metadata (dict): The task metadata for the job.
         slurm_username (str): The SLURM job username.
+        slurm_job_status_metadata (SlurmJobSummary): The current SLURM job status,
+            if already retrieved from the SLURM scheduler by the caller.
 
     Returns:
         bool: True if the job was successfully added to the monitor database, False otherwise.
     """
-    from app.helpers import (
-        get_slurm_proxy_app,
-    )
     app = get_slurm_proxy_app()
-    if slurm_job_state == SLURM_STATE_UNKNOWN:
+    if slurm_job_state == SLURM_STATE_UNKNOWN and slurm_job_status_metadata is None:
         current_slurm_job_metadata = get_current_slurm_job_metadata_by_slurm_job_id(
             slurm_job_id,
             slurm_username,
         )
         if current_slurm_job_metadata:
-            slurm_job_state = current_slurm_job_metadata["state"]
+            slurm_job_state = current_slurm_job_metadata.get_job_state()
     job = MonitorJobSummary(
         slurm_username=slurm_username,
         slurm_job_id=slurm_job_id,
@@ -344,10 +454,12 @@ def add_job_to_monitor_db(
     )
     try:
         jobs_coll = mongodb_connection.get_monitor_jobs_collection()
-        if not jobs_coll.find_one(
-            {"slurm_job_id": slurm_job_id}
-        ) and not jobs_coll.find_one({"task.uuid": slurm_job_task_metadata["uuid"]}):
-            jobs_coll.insert_one(job.to_dict())
+        jobs_coll.insert_one(job.to_dict())
+        return True
+    except pymongo.errors.DuplicateKeyError:
+        app.logger.debug(
+            f"add_job_to_monitor_db | Job {slurm_job_id} is already in monitor database"
+        )
         return True
     except pymongo.errors.PyMongoError as err:
         app.logger.error(
@@ -356,25 +468,28 @@ def add_job_to_monitor_db(
         return False
 
 
-def get_job_metadata_from_monitor_db_by_query(query: dict) -> dict:
+def get_job_metadata_from_monitor_db_by_query(query: dict, projection: dict = None) -> dict:
     """
     Retrieve job metadata from the monitor database using a pymongo query.
 
+    The document's `_id` is excluded by the database, as it is not part of the
+    job metadata.
+
     Args:
         query (dict): A pymongo query to filter the job metadata.
+        projection (dict): The fields of the job metadata to retrieve, if not all
+            of them are needed (e.g., to test whether a job is monitored).
     """
-    from app.helpers import (
-        get_slurm_proxy_app,
-    )
     app = get_slurm_proxy_app()
     try:
         jobs_coll = mongodb_connection.get_monitor_jobs_collection()
-        result = jobs_coll.find_one(query)
+        result = jobs_coll.find_one(query, {"_id": 0, **(projection or {})})
         # clean up MonitorJob object for JSON serialization
         if result:
-            result['_id'] = str(result['_id']) if result.get('_id') else None
-            result['created_at'] = result['created_at'].isoformat() if result.get('created_at') else None
-            result['updated_at'] = result['updated_at'].isoformat() if result.get('updated_at') else None
+            if 'created_at' in result:
+                result['created_at'] = result['created_at'].isoformat() if result['created_at'] else None
+            if 'updated_at' in result:
+                result['updated_at'] = result['updated_at'].isoformat() if result['updated_at'] else None
         return result if result else None
     except pymongo.errors.PyMongoError as err:
         app.logger.error(
@@ -383,41 +498,52 @@ def get_job_metadata_from_monitor_db_by_query(query: dict) -> dict:
         return None
 
 
-def update_job_state_in_monitor_db(slurm_job_id: int, new_slurm_job_state: str) -> bool:
+def update_job_state_in_monitor_db(
+    slurm_job_id: int,
+    new_slurm_job_state: str,
+    old_slurm_job_state: str = None,
+) -> bool:
     """
     Update the job state key in the monitor database, as well as the updated
     timestamp.
 
-    The job dictionary should contain the SLURM job ID and task information.
-    
-    The SLURM job state is retrieved from the SLURM scheduler.
+    If the old job state is given, the job is only updated if it is still in that
+    state, in a single atomic `find_one_and_update`. Only one caller can then
+    record a given state change, even if the job is polled concurrently (e.g., by
+    more than one instance of the application), so that the change is only
+    notified about once.
+
+    Once the job state is updated, any cached SLURM REST API status for the job is
+    dropped, so that it is not reported with its old state.
 
     Args:
         slurm_job_id (int): The SLURM job ID.
         new_slurm_job_state (str): The new SLURM job state.
+        old_slurm_job_state (str): The SLURM job state the job is expected to be in.
 
     Returns:
-        bool: True if the job state was successfully updated, False otherwise.
+        bool: True if the job state was updated by this call, False otherwise.
     """
-    from app.helpers import (
-        get_slurm_proxy_app,
-        get_current_datetime,
-    )
     app = get_slurm_proxy_app()
+    query = {"slurm_job_id": slurm_job_id}
+    if old_slurm_job_state is not None:
+        query["slurm_job_state"] = old_slurm_job_state
     try:
         jobs_coll = mongodb_connection.get_monitor_jobs_collection()
-        result = jobs_coll.update_one(
-            {"slurm_job_id": slurm_job_id},
+        result = jobs_coll.find_one_and_update(
+            query,
             {"$set": {
                 "slurm_job_state": new_slurm_job_state,
                 "updated_at": get_current_datetime(),
             }},
+            projection={"_id": 1},
         )
-        if result.modified_count == 0:
-            app.logger.error(
-                f"update_job_state_in_monitor_db | More than one job entry exists for Slurm job: {slurm_job_id}"
+        if result is None:
+            app.logger.warning(
+                f"update_job_state_in_monitor_db | Job {slurm_job_id} not found in monitor database, or its state has already changed"
             )
             return False
+        invalidate_slurm_rest_job_status_cache([slurm_job_id])
         return True
     except pymongo.errors.PyMongoError as err:
         app.logger.error(
@@ -426,6 +552,61 @@ def update_job_state_in_monitor_db(slurm_job_id: int, new_slurm_job_state: str)
         return False
 
 
+def update_job_states_in_monitor_db(
+    new_slurm_job_states: dict,
+    old_slurm_job_states: dict = None,
+) -> bool:
+    """
+    Update the job state key in the monitor database, as well as the updated
+    timestamp, for several jobs at once.
+
+    All updates are sent to the monitor database in a single unordered bulk write,
+    rather than with one round-trip per job. Jobs that are no longer in the monitor
+    database (e.g., deleted since they were read) are skipped, as are jobs that are
+    no longer in their old state, if given. Any cached SLURM REST API status for
+    the jobs is dropped once the job states are written.
+
+    Args:
+        new_slurm_job_states (dict): The new SLURM job state, keyed by SLURM job ID.
+        old_slurm_job_states (dict): The SLURM job state each job is expected to be
+            in, keyed by SLURM job ID.
+
+    Returns:
+        bool: True if the job states were written, False if the write failed.
+    """
+    app = get_slurm_proxy_app()
+    if not new_slurm_job_states:
+        return True
+    updated_at = get_current_datetime()
+    ops = [
+        pymongo.UpdateOne(
+            (
+                {"slurm_job_id": slurm_job_id, "slurm_job_state": old_slurm_job_states[slurm_job_id]}
+                if old_slurm_job_states and slurm_job_id in old_slurm_job_states
+                else {"slurm_job_id": slurm_job_id}
+            ),
+            {"$set": {
+                "slurm_job_state": new_slurm_job_state,
+                "updated_at": updated_at,
+            }},
+        )
+        for slurm_job_id, new_slurm_job_state in new_slurm_job_states.items()
+    ]
+    try:
+        result = mongodb_connection.bulk_update_jobs(ops)
+        if result.matched_count != len(ops):
+            app.logger.warning(
+                f"update_job_states_in_monitor_db | Only {result.matched_count} of {len(ops)} job entries were found for Slurm jobs: {list(new_slurm_job_states.keys())}"
+            )
+        invalidate_slurm_rest_job_status_cache(new_slurm_job_states.keys())
+        return True
+    except pymongo.errors.PyMongoError as err:
+        app.logger.error(
+            f"update_job_states_in_monitor_db | Error updating job states in monitor database: {err}"
+        )
+        return False
+
+
 def remove_job_from_monitor_db_by_slurm_job_id(slurm_job_id: int) -> bool:
     """
     Remove a job from the monitor database using the SLURM job ID.
@@ -436,9 +617,6 @@ def remove_job_from_monitor_db_by_slurm_job_id(slurm_job_id: int) -> bool:
     Returns:
         bool: True if the job was successfully removed, False otherwise.
     """
-    from app.helpers import (
-        get_slurm_proxy_app,
-    )
     app = get_slurm_proxy_app()
     try:
         jobs_coll = mongodb_connection.get_monitor_jobs_collection()
@@ -451,22 +629,25 @@ def remove_job_from_monitor_db_by_slurm_job_id(slurm_job_id: int) -> bool:
         return False
 
 
-def remove_and_return_job_from_monitor_db_by_slurm_job_id(slurm_job_id: int) -> dict:
+def remove_and_return_job_from_monitor_db_by_slurm_job_id(slurm_job_id: int, raw: bool = False) -> dict:
     """
     Remove a job from the monitor database and return the job metadata.
 
     Args:
         slurm_job_id (int): The SLURM job ID.
+        raw (bool): If True, return the job metadata as a RawBSONDocument, to be
+            passed on as BSON without being decoded.
 
     Returns:
         dict: A dictionary containing the job metadata, or None if the job was not found.
     """
-    from app.helpers import (
-        get_slurm_proxy_app,
-    )
     app = get_slurm_proxy_app()
     try:
-        jobs_coll = mongodb_connection.get_monitor_jobs_collection()
+        jobs_coll = (
+            mongodb_connection.get_monitor_jobs_raw_collection()
+            if raw
+            else mongodb_connection.get_monitor_jobs_collection()
+        )
         result = jobs_coll.find_one_and_delete({"slurm_job_id": slurm_job_id})
         return result
     except pymongo.errors.PyMongoError as err:
@@ -492,10 +673,22 @@ def get_current_slurm_job_metadata_by_slurm_job_id(
 def get_current_slurm_job_metadata_by_slurm_job_id_via_rest(
     slurm_job_id: int, slurm_username: str
 ) -> SlurmJobSummary:
-    from app.helpers import (
-        get_slurm_proxy_app,
-    )
-    app = get_slurm_proxy_app()
+    """
+    Get the current SLURM job metadata by job ID via the SLURM REST API.
+
+    Results are cached for `constants.SLURM_REST_JOB_STATUS_CACHE_TTL` seconds, so
+    that repeated requests for the same job in quick succession do not each query
+    the SLURM REST API. If a query fails, a cached result up to
+    `constants.SLURM_REST_JOB_STATUS_CACHE_STALE_TTL` seconds older than that is
+    returned instead.
+
+    Args:
+        slurm_job_id (int): The SLURM job ID.
+        slurm_username (str): The SLURM job username.
+
+    Returns:
+        SlurmJobSummary: The job metadata, or None if the job was not found.
+    """
     if not slurm_job_id:
         return None
     if not slurm_username:
@@ -503,9 +696,67 @@ def get_current_slurm_job_metadata_by_slurm_job_id_via_rest(
     # test case
     if slurm_job_id == SLURM_TEST_JOB_ID:
         return SLURM_TEST_JOB_STATUS
-    # REST API call to get the job status
-    from app.task_slurm_rest import get_job_info_for_job_id_via_params
+    if SLURM_REST_JOB_STATUS_CACHE_TTL <= 0:
+        return query_current_slurm_job_metadata_by_slurm_job_id_via_rest(slurm_job_id, slurm_username)
+    cache_key = (slurm_job_id, slurm_username)
+    with slurm_rest_job_status_cache_lock:
+        cached_result = slurm_rest_job_status_cache.get(cache_key)
+    if cached_result and time.monotonic() < cached_result[1]:
+        return cached_result[0]
+    result = query_current_slurm_job_metadata_by_slurm_job_id_via_rest(slurm_job_id, slurm_username)
+    now = time.monotonic()
+    if not result:
+        if cached_result and now < cached_result[2]:
+            app = get_slurm_proxy_app()
+            app.logger.warning(
+                f"get_current_slurm_job_metadata_by_slurm_job_id_via_rest | Using stale job status for job ID {slurm_job_id} and user {slurm_username}"
+            )
+            return cached_result[0]
+        return result
+    with slurm_rest_job_status_cache_lock:
+        if len(slurm_rest_job_status_cache) >= SLURM_REST_JOB_STATUS_CACHE_MAXSIZE:
+            for key in [k for k, v in slurm_rest_job_status_cache.items() if v[2] <= now]:
+                del slurm_rest_job_status_cache[key]
+            if len(slurm_rest_job_status_cache) >= SLURM_REST_JOB_STATUS_CACHE_MAXSIZE:
+                slurm_rest_job_status_cache.clear()
+        expiry = now + SLURM_REST_JOB_STATUS_CACHE_TTL
+        slurm_rest_job_status_cache[cache_key] = (
+            result,
+            expiry,
+            expiry + SLURM_REST_JOB_STATUS_CACHE_STALE_TTL,
+        )
+    return result
 
+
+def invalidate_slurm_rest_job_status_cache(slurm_job_ids) -> None:
+    """
+    Drop the cached SLURM REST API job status of the given jobs, for any username
+    they were queried with.
+
+    Args:
+        slurm_job_ids (iterable): The SLURM job IDs.
+    """
+    slurm_job_ids = set(slurm_job_ids)
+    with slurm_rest_job_status_cache_lock:
+        for key in [k for k in slurm_rest_job_status_cache if k[0] in slurm_job_ids]:
+            del slurm_rest_job_status_cache[key]
+
+
+def query_current_slurm_job_metadata_by_slurm_job_id_via_rest(
+    slurm_job_id: int, slurm_username: str
+) -> SlurmJobSummary:
+    """
+    Query the SLURM REST API job endpoint for the current SLURM job metadata of a job.
+
+    Args:
+        slurm_job_id (int): The SLURM job ID.
+        slurm_username (str): The SLURM job username.
+
+    Returns:
+        SlurmJobSummary: The job metadata, or None if the job was not found.
+    """
+    app = get_slurm_proxy_app()
+    # REST API call to get the job status
     (
         job_status_response,
         job_status_response_code,
@@ -513,17 +764,39 @@ def get_current_slurm_job_metadata_by_slurm_job_id_via_rest(
     ) = get_job_info_for_job_id_via_params(slurm_job_id, slurm_username)
     if not job_status_response or job_status_response_code != 200:
         app.logger.error(
-            f"get_current_slurm_job_metadata_by_slurm_job_id_via_rest | No job status information found for job ID {slurm_job_id} and user {slurm_username} | {job_status_response_code} | {query_url}"
+            f"query_current_slurm_job_metadata_by_slurm_job_id_via_rest | No job status information found for job ID {slurm_job_id} and user {slurm_username} | {job_status_response_code} | {query_url}"
         )
         return None
     job_status_jobs = job_status_response.get("jobs", None)
     if not job_status_jobs or len(job_status_jobs) == 0:
         app.logger.error(
-            f"get_current_slurm_job_metadata_by_slurm_job_id_via_rest | No job status information found for job ID {slurm_job_id} and user {slurm_username}"
+            f"query_current_slurm_job_metadata_by_slurm_job_id_via_rest | No job status information found for job ID {slurm_job_id} and user {slurm_username}"
         )
         return None
     job_status_job_instance = job_status_jobs[0]
-    # ref. https://slurm.schedmd.com/rest_api.html#v0.0.42_openapi_slurmdbd_jobs_resp
+    return get_slurm_job_metadata_from_rest_job_instance(
+        slurm_job_id, slurm_username, job_status_job_instance
+    )
+
+
+def get_slurm_job_metadata_from_rest_job_instance(
+    slurm_job_id: int, slurm_username: str, job_status_job_instance: dict
+) -> SlurmJobSummary:
+    """
+    Get the SLURM job metadata from a job instance, as returned by the SLURM REST
+    API jobs endpoints.
+
+    ref. https://slurm.schedmd.com/rest_api.html#v0.0.42_openapi_slurmdbd_jobs_resp
+
+    Args:
+        slurm_job_id (int): The SLURM job ID.
+        slurm_username (str): The SLURM job username.
+        job_status_job_instance (dict): The job instance from the REST API response.
+
+    Returns:
+        SlurmJobSummary: The job metadata, or None if the job instance could not be read.
+    """
+    app = get_slurm_proxy_app()
     try:
         result = SlurmJobSummary(
             username=slurm_username,
@@ -539,7 +812,7 @@ def get_current_slurm_job_metadata_by_slurm_job_id_via_rest(
         if job_status_job_instance["user"] != slurm_username:
             result.set_username(job_status_job_instance["user"])
             app.logger.warning(
-                f"get_current_slurm_job_metadata_by_slurm_job_id_via_rest | Job {slurm_job_id} is not owned by user {slurm_username}"
+                f"get_slurm_job_metadata_from_rest_job_instance | Job {slurm_job_id} is not owned by user {slurm_username}"
             )
             # raise NameError(
             #     f"Job {slurm_job_id} is not owned by user {slurm_username}"
@@ -547,12 +820,12 @@ def get_current_slurm_job_metadata_by_slurm_job_id_via_rest(
         return result
     except TypeError as err:
         app.logger.error(
-            f"get_current_slurm_job_metadata_by_slurm_job_id_via_rest | Error: {err} | {job_status_job_instance}"
+            f"get_slurm_job_metadata_from_rest_job_instance | Error: {err} | {job_status_job_instance}"
         )
         return None
     except NameError as err:
         app.logger.error(
-            f"get_current_slurm_job_metadata_by_slurm_job_id_via_rest | Error: {err} | {job_status_job_instance}"
+            f"get_slurm_job_metadata_from_rest_job_instance | Error: {err} | {job_status_job_instance}"
         )
         return None
 
@@ -570,9 +843,6 @@ def get_current_slurm_job_metadata_by_slurm_job_id_via_ssh(
     Returns:
         dict: A dictionary containing the job metadata, or None if the job was not found.
     """
-    from app.helpers import (
-        get_slurm_proxy_app,
-    )
     app = get_slurm_proxy_app()
     if not slurm_job_id:
         return None
@@ -580,37 +850,15 @@ def get_current_slurm_job_metadata_by_slurm_job_id_via_ssh(
     if slurm_job_id == SLURM_TEST_JOB_ID:
         return SLURM_TEST_JOB_STATUS
     # SSH command to get the job status
-    cmd = " ".join(
-        [
-            str(x)
-            for x in [
-                "sacct",
-                "-j",
-                slurm_job_id,
-                "--format=JobID,Jobname%-128,state,User,partition,time,start,end,elapsed",
-                "--noheader",
-                "--parsable2",
-            ]
-        ]
-    )
+    cmd = SACCT_JOB_ID_CMD.format(slurm_job_id=shlex.quote(str(slurm_job_id)))
     try:
         (stdin, stdout, stderr) = ssh_connection.ssh_client_exec(cmd)
-        job_status_str = stdout.read().decode("utf-8").strip()
-        if not job_status_str:
+        # only the first line (the job allocation) is used, so the rest of the
+        # output (e.g., job steps) is not read
+        job_status = next(parse_sacct_job_status_lines(iter_ssh_output_lines(stdout)), None)
+        stdout.channel.close()
+        if not job_status:
             return None
-        job_status_components = job_status_str.split("\n")[0].split("|")
-        job_status_keys = [
-            "job_id",
-            "job_name",
-            "state",
-            "user",
-            "partition",
-            "time",
-            "start",
-            "end",
-            "elapsed",
-        ]
-        job_status = dict(zip(job_status_keys, job_status_components))
         if job_status["state"] not in SLURM_STATES_ALLOWED:
             job_status["state"] = SLURM_STATE_UNKNOWN
         if job_status["user"] != slurm_username:
@@ -636,6 +884,219 @@ def get_current_slurm_job_metadata_by_slurm_job_id_via_ssh(
         return None
 
 
+def get_current_slurm_jobs_metadata_by_slurm_job_ids(slurm_job_ids: dict) -> dict:
+    """
+    Get the current SLURM job metadata for a batch of jobs, using as few
+    round-trips to the SLURM scheduler as the communication method allows.
+
+    Args:
+        slurm_job_ids (dict): A dictionary mapping SLURM job IDs to SLURM job usernames.
+
+    Returns:
+        dict: A dictionary mapping SLURM job IDs to SlurmJobSummary objects. Jobs that
+            were not found in the SLURM scheduler are omitted.
+    """
+    if SLURM_COMMUNICATION_METHOD == SlurmCommunicationMethods.SSH:
+        return get_current_slurm_jobs_metadata_by_slurm_job_ids_via_ssh(slurm_job_ids)
+    elif SLURM_COMMUNICATION_METHOD == SlurmCommunicationMethods.REST:
+        return get_current_slurm_jobs_metadata_by_slurm_job_ids_via_rest(slurm_job_ids)
+
+
+def get_current_slurm_jobs_metadata_by_slurm_job_ids_via_rest(slurm_job_ids: dict) -> dict:
+    """
+    Get the current SLURM job metadata for a batch of jobs via the SLURM REST API.
+
+    As the JWT token used for each query is specific to a username, the REST API
+    jobs endpoint is queried once per username, rather than once per job, for jobs
+    submitted within `constants.MONGODB_MONITOR_JOB_CREATED_AT_MAX_AGE`. Any jobs
+    missing from these results are then queried one at a time via the job endpoint. Up to
+    `constants.MONITOR_POLLING_CONCURRENCY` queries are made concurrently.
+
+    Args:
+        slurm_job_ids (dict): A dictionary mapping SLURM job IDs to SLURM job usernames.
+
+    Returns:
+        dict: A dictionary mapping SLURM job IDs to SlurmJobSummary objects.
+    """
+    app = get_slurm_proxy_app()
+    result = {}
+    if not slurm_job_ids:
+        return result
+    slurm_job_ids_by_username = {}
+    for slurm_job_id, slurm_username in slurm_job_ids.items():
+        if slurm_job_id == SLURM_TEST_JOB_ID:
+            continue
+        slurm_username = slurm_username or SLURM_REST_GENERIC_USERNAME
+        slurm_job_ids_by_username.setdefault(slurm_username, []).append(slurm_job_id)
+    if slurm_job_ids_by_username:
+        start_time = int(time.time()) - MONGODB_MONITOR_JOB_CREATED_AT_MAX_AGE
+        max_workers = min(MONITOR_POLLING_CONCURRENCY, len(slurm_job_ids_by_username))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                slurm_username: executor.submit(
+                    get_jobs_info_for_username_via_params,
+                    slurm_username,
+                    start_time,
+                )
+                for slurm_username in slurm_job_ids_by_username
+            }
+            for slurm_username, future in futures.items():
+                try:
+                    (
+                        jobs_status_response,
+                        jobs_status_response_code,
+                        query_url,
+                    ) = future.result()
+                except Exception as err:
+                    app.logger.error(
+                        f"get_current_slurm_jobs_metadata_by_slurm_job_ids_via_rest | Error querying jobs of user {slurm_username}: {err}"
+                    )
+                    continue
+                if not jobs_status_response or jobs_status_response_code != 200:
+                    app.logger.error(
+                        f"get_current_slurm_jobs_metadata_by_slurm_job_ids_via_rest | No job status information found for user {slurm_username} | {jobs_status_response_code} | {query_url}"
+                    )
+                    continue
+                job_status_job_instances = {}
+                for job_status_job_instance in jobs_status_response.get("jobs") or []:
+                    job_status_job_instances.setdefault(
+                        job_status_job_instance.get("job_id"), job_status_job_instance
+                    )
+                for slurm_job_id in slurm_job_ids_by_username[slurm_username]:
+                    job_status_job_instance = job_status_job_instances.get(slurm_job_id)
+                    if not job_status_job_instance:
+                        continue
+                    slurm_job_status_metadata = get_slurm_job_metadata_from_rest_job_instance(
+                        slurm_job_id, slurm_username, job_status_job_instance
+                    )
+                    if slurm_job_status_metadata:
+                        result[slurm_job_id] = slurm_job_status_metadata
+    unmatched_slurm_job_ids = {
+        slurm_job_id: slurm_username
+        for slurm_job_id, slurm_username in slurm_job_ids.items()
+        if slurm_job_id not in result
+    }
+    if not unmatched_slurm_job_ids:
+        return result
+    max_workers = min(MONITOR_POLLING_CONCURRENCY, len(unmatched_slurm_job_ids))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            slurm_job_id: executor.submit(
+                get_current_slurm_job_metadata_by_slurm_job_id_via_rest,
+                slurm_job_id,
+                slurm_username,
+            )
+            for slurm_job_id, slurm_username in unmatched_slurm_job_ids.items()
+        }
+        for slurm_job_id, future in futures.items():
+            try:
+                slurm_job_status_metadata = future.result()
+            except Exception as err:
+                app.logger.error(
+                    f"get_current_slurm_jobs_metadata_by_slurm_job_ids_via_rest | Error querying job {slurm_job_id}: {err}"
+                )
+                continue
+            if slurm_job_status_metadata:
+                result[slurm_job_id] = slurm_job_status_metadata
+    return result
+
+
+def get_current_slurm_jobs_metadata_by_slurm_job_ids_via_ssh(slurm_job_ids: dict) -> dict:
+    """
+    Get the current SLURM job metadata for a batch of jobs via SSH, with a single
+    `sacct` call covering all of the specified job IDs.
+
+    Args:
+        slurm_job_ids (dict): A dictionary mapping SLURM job IDs to SLURM job usernames.
+
+    Returns:
+        dict: A dictionary mapping SLURM job IDs to SlurmJobSummary objects.
+    """
+    app = get_slurm_proxy_app()
+    result = {}
+    if not slurm_job_ids:
+        return result
+    cmd = SACCT_JOB_IDS_CMD.format(
+        slurm_job_ids=shlex.quote(",".join([str(slurm_job_id) for slurm_job_id in slurm_job_ids]))
+    )
+    try:
+        (stdin, stdout, stderr) = ssh_connection.ssh_client_exec(cmd)
+    except (TypeError, AttributeError) as err:
+        app.logger.error(
+            f"get_current_slurm_jobs_metadata_by_slurm_job_ids_via_ssh | Error: {err}"
+        )
+        return result
+    for job_status in parse_sacct_job_status_lines(iter_ssh_output_lines(stdout)):
+        try:
+            slurm_job_id = int(job_status["job_id"])
+        except (KeyError, ValueError):
+            continue
+        if slurm_job_id not in slurm_job_ids:
+            continue
+        slurm_username = slurm_job_ids[slurm_job_id]
+        # jobs submitted without a username are not checked for ownership, as the
+        # generic username never matches the owner reported by `sacct`
+        if (
+            slurm_username
+            and slurm_username != SLURM_REST_GENERIC_USERNAME
+            and job_status.get("user") != slurm_username
+        ):
+            app.logger.error(
+                f"get_current_slurm_jobs_metadata_by_slurm_job_ids_via_ssh | Job {slurm_job_id} is not owned by user {slurm_username}"
+            )
+            continue
+        if job_status.get("state") not in SLURM_STATES_ALLOWED:
+            job_status["state"] = SLURM_STATE_UNKNOWN
+        result[slurm_job_id] = SlurmJobSummary(
+            username=job_status["user"],
+            job_id=slurm_job_id,
+            job_state=job_status["state"],
+        )
+    exit_code = stdout.channel.recv_exit_status()
+    if exit_code != 0:
+        app.logger.error(
+            f'get_current_slurm_jobs_metadata_by_slurm_job_ids_via_ssh | Failed to get job status from SLURM ({exit_code}): {stderr.read().decode("utf-8")}'
+        )
+        return {}
+    return result
+
+
+def iter_ssh_output_lines(stream) -> Iterator[str]:
+    """
+    Iterate over the output of a command run via SSH, line by line, as it is received.
+
+    Args:
+        stream (paramiko.ChannelFile): The output stream of the command.
+
+    Yields:
+        str: Each line of output.
+    """
+    for line in stream:
+        yield line.decode("utf-8") if isinstance(line, bytes) else line
+
+
+def parse_sacct_job_status_lines(job_status_strs) -> Iterator[dict]:
+    """
+    Parse `sacct --parsable2` output, as requested with `SACCT_JOB_STATUS_FORMAT`.
+
+    Lines are tokenized with the C-level `csv` reader, rather than split field
+    by field in Python. The output can be given as an iterable of lines (e.g.,
+    from `iter_ssh_output_lines`), so that it is parsed while it is received.
+
+    Args:
+        job_status_strs (str | Iterable[str]): The `sacct` output, with one job per line.
+
+    Yields:
+        dict: The job status fields of each job, keyed by `SACCT_JOB_STATUS_KEYS`.
+    """
+    if isinstance(job_status_strs, str):
+        job_status_strs = io.StringIO(job_status_strs)
+    reader = csv.reader(job_status_strs, delimiter="|", quoting=csv.QUOTE_NONE)
+    for job_status_components in reader:
+        if job_status_components:
+            yield dict(zip(SACCT_JOB_STATUS_KEYS, job_status_components))
+
+
 def get_slurm_jobs_metadata_by_slurm_job_state_via_ssh(slurm_job_state: str) -> dict:
     """
     Get SLURM job metadata by job state.
@@ -647,112 +1108,118 @@ def get_slurm_jobs_metadata_by_slurm_job_state_via_ssh(slurm_job_state: str) ->
     Returns:
         dict: A dictionary containing the job metadata for the given state.
     """
-    from app.helpers import (
-        get_slurm_proxy_app,
-    )
     app = get_slurm_proxy_app()
     if not slurm_job_state:
         return None
-    cmd = " ".join(
-        [
-            str(x)
-            for x in [
-                "sacct",
-                "--state",
-                slurm_job_state,
-                "--format=JobID,Jobname%-128,state,User,partition,time,start,end,elapsed",
-                "--noheader",
-                "--parsable2",
-            ]
-        ]
-    )
+    cmd = SACCT_JOB_STATE_CMD.format(slurm_job_state=shlex.quote(slurm_job_state))
     (stdin, stdout, stderr) = ssh_connection.ssh_client_exec(cmd)
-    job_status_strs = stdout.read().decode("utf-8").strip()
-    if not job_status_strs:
-        return None
     jobs_status = {"jobs": []}
-    for job_status_str in job_status_strs.split("\n"):
-        job_status_components = job_status_str.split("|")
-        job_status_keys = [
-            "job_id",
-            "job_name",
-            "state",
-            "user",
-            "partition",
-            "time",
-            "start",
-            "end",
-            "elapsed",
-        ]
-        job_status_instance = dict(zip(job_status_keys, job_status_components))
+    for job_status_instance in parse_sacct_job_status_lines(iter_ssh_output_lines(stdout)):
         if job_status_instance["state"] not in SLURM_STATES_ALLOWED:
             job_status_instance["state"] = SLURM_STATE_UNKNOWN
         jobs_status["jobs"].append(job_status_instance)
+    if not jobs_status["jobs"]:
+        return None
     return jobs_status
 
 
 def poll_slurm_jobs() -> None:
     """
-    Poll the SLURM scheduler periodically for job status updates. Timer value is set
-    in `constants.MONITOR_POLLING_INTERVAL`.
+    Poll the SLURM scheduler periodically for job status updates.
 
     This function checks the status of all unfinished jobs in the monitor database no 
     older than the value of `constants.MONGODB_MONITOR_JOB_CREATED_AT_MAX_AGE` and 
     updates the job state if there are any changes.
     
     If a job is marked as finished, a state change event is triggered.
+
+    The status of all unfinished jobs is requested from the SLURM scheduler as a
+    batch, rather than with one query per job, and any changed job states are
+    written back to the monitor database in a single bulk write. Changes to an end
+    state are instead written one job at a time, with `update_job_state_in_monitor_db`,
+    and a state change event is only triggered if that write recorded the change.
     """
-    from app.helpers import (
-        get_slurm_proxy_app,
-        get_current_datetime_minus_interval,
-    )
     app = get_slurm_proxy_app()
-    app.logger.debug(f"poll_slurm_jobs | Polling SLURM jobs...")
     try:
         jobs_coll = mongodb_connection.get_monitor_jobs_collection()
+        app.logger.debug(f"poll_slurm_jobs | Polling SLURM jobs...")
         query = {
             "slurm_job_state": {
-                "$nin": SLURM_STATE_END_STATES
+                "$nin": list(SLURM_STATE_END_STATES)
             },
             "created_at": {
                 "$gte": get_current_datetime_minus_interval(MONGODB_MONITOR_JOB_CREATED_AT_MAX_AGE),
             },
         }
-        jobs = jobs_coll.find(query)
-        for job in jobs:
+        projection = {"_id": 0, "slurm_job_id": 1, "slurm_job_state": 1, "task": 1}
+        monitor_db_job_states = {}
+        monitor_db_job_tasks = {}
+        slurm_usernames = {}
+        for job in jobs_coll.find(query, projection).batch_size(MONGODB_MONITOR_JOBS_BATCH_SIZE):
             slurm_job_id = int(job["slurm_job_id"])
-            monitor_db_job_state = job["slurm_job_state"]
-            slurm_username = job["task"].get("username", SLURM_REST_GENERIC_USERNAME)
-            app.logger.debug(f"poll_slurm_jobs | Testing {slurm_job_id} | {monitor_db_job_state}")
-            slurm_job_status_metadata = get_current_slurm_job_metadata_by_slurm_job_id(
-                slurm_job_id,
-                slurm_username,
-            )
-            app.logger.debug(f"poll_slurm_jobs | Job {slurm_job_id} status metadata: {slurm_job_status_metadata}")
+            monitor_db_job_states[slurm_job_id] = job["slurm_job_state"]
+            monitor_db_job_tasks[slurm_job_id] = job["task"]
+            slurm_usernames[slurm_job_id] = job["task"].get("username", SLURM_REST_GENERIC_USERNAME)
+        if not monitor_db_job_states:
+            return
+        slurm_jobs_status_metadata = get_current_slurm_jobs_metadata_by_slurm_job_ids(slurm_usernames)
+        new_slurm_job_states = {}
+        # per-job debug messages are only formatted if they will be logged
+        log_debug = app.logger.isEnabledFor(logging.DEBUG)
+        for slurm_job_id, monitor_db_job_state in monitor_db_job_states.items():
+            slurm_job_status_metadata = slurm_jobs_status_metadata.get(slurm_job_id, None)
+            if log_debug:
+                app.logger.debug(f"poll_slurm_jobs | Testing {slurm_job_id} | {monitor_db_job_state}")
+                app.logger.debug(f"poll_slurm_jobs | Job {slurm_job_id} status metadata: {slurm_job_status_metadata}")
             # test if job metadata are not found in SLURM scheduler for specified ID and username
             if not slurm_job_status_metadata:
                 continue
             current_slurm_job_state = slurm_job_status_metadata.get_job_state()
-            if monitor_db_job_state != current_slurm_job_state:
-                app.logger.debug(f"poll_slurm_jobs | Job {slurm_job_id} monitor state: {monitor_db_job_state} | SLURM state: {current_slurm_job_state}")
-                new_slurm_job_state = (
-                    current_slurm_job_state
-                    if current_slurm_job_state in SLURM_STATES_ALLOWED
-                    else SLURM_STATE_UNKNOWN
+            new_slurm_job_state = (
+                current_slurm_job_state
+                if current_slurm_job_state in SLURM_STATES_ALLOWED
+                else SLURM_STATE_UNKNOWN
+            )
+            # only jobs whose state has changed are written back and notified about
+            if monitor_db_job_state != new_slurm_job_state:
+                if log_debug:
+                    app.logger.debug(f"poll_slurm_jobs | Job {slurm_job_id} monitor state: {monitor_db_job_state} | SLURM state: {current_slurm_job_state}")
+                new_slurm_job_states[slurm_job_id] = new_slurm_job_state
+        # job states that are not end states are written back in a single bulk write
+        result = update_job_states_in_monitor_db(
+            {
+                slurm_job_id: new_slurm_job_state
+                for slurm_job_id, new_slurm_job_state in new_slurm_job_states.items()
+                if new_slurm_job_state not in SLURM_STATE_END_STATES
+            },
+            monitor_db_job_states,
+        )
+        if not result:
+            app.logger.error(
+                f"poll_slurm_jobs | Failed to update job states in monitor database for jobs {list(new_slurm_job_states.keys())}"
+            )
+        # end states are written one job at a time, and only notified about if this
+        # poll recorded the change; otherwise, the job state is left as it was, so
+        # that the change is picked up, and notified about, on the next poll
+        for slurm_job_id, new_slurm_job_state in new_slurm_job_states.items():
+            if new_slurm_job_state not in SLURM_STATE_END_STATES:
+                continue
+            if not update_job_state_in_monitor_db(
+                slurm_job_id,
+                new_slurm_job_state,
+                monitor_db_job_states[slurm_job_id],
+            ):
+                continue
+            result = process_job_state_change(
+                slurm_job_id,
+                monitor_db_job_states[slurm_job_id],
+                new_slurm_job_state,
+                monitor_db_job_tasks[slurm_job_id],
+            )
+            if not result:
+                app.logger.error(
+                    f"poll_slurm_jobs | Failed to process job state change for job {slurm_job_id}"
                 )
-                if new_slurm_job_state in SLURM_STATE_END_STATES:
-                    result = process_job_state_change(
-                        slurm_job_id, monitor_db_job_state, new_slurm_job_state
-                    )
-                    if not result:
-                        app.logger.error(
-                            f"poll_slurm_jobs | Failed to process job state change for job {slurm_job_id}"
-                        )
-                result = update_job_state_in_monitor_db(slurm_job_id, new_slurm_job_state)
-                if not result:
-                    app.logger.error(
-                        f"poll_slurm_jobs | Failed to update job state in monitor database for job {slurm_job_id}"
-                    )
     except pymongo.errors.PyMongoError as err:
         app.logger.error(
             f"poll_slurm_jobs | Error polling SLURM jobs in monitor db: {err}"
@@ -760,7 +1227,10 @@ def poll_slurm_jobs() -> None:
 
 
 def process_job_state_change(
-    slurm_job_id: int, old_slurm_job_state: str, new_slurm_job_state: str
+    slurm_job_id: int,
+    old_slurm_job_state: str,
+    new_slurm_job_state: str,
+    task: dict = None,
 ) -> bool:
     """
     Handle the job state change here. This would be typically called when the
@@ -769,30 +1239,32 @@ def process_job_state_change(
     A state change event may be handled by sending a notification message to a
     RabbitMQ queue, for instance, and/or an email, and/or a Slack message to a
     particular channel, as defined in the TASK_METADATA object. Other methods
-    may be exposed in task_notification.py.
+    may be exposed in task_notification.py. Messages are sent in the background,
+    via `dispatch_job_state_change_notifications`.
 
     Args:
         slurm_job_id (int): The SLURM job ID.
         old_slurm_job_state (str): The old SLURM job state.
         new_slurm_job_state (str): The new SLURM job state.
+        task (dict): The task metadata of the job, if already read from the monitor
+            database by the caller. Otherwise, it is looked up by SLURM job ID.
 
     Returns:
-        bool: True if the job state change was successfully processed, False otherwise.
+        bool: True if the job state change was successfully processed (i.e., any
+            notification messages were dispatched), False otherwise (e.g., if a
+            notification method is unknown).
     """
-    from app.helpers import (
-        get_slurm_proxy_app,
-    )
     app = get_slurm_proxy_app()
     app.logger.info(
         f"process_job_state_change | Processing job state change: {slurm_job_id}: {old_slurm_job_state} -> {new_slurm_job_state}"
     )
     if new_slurm_job_state in SLURM_STATE_END_STATES:
-        app.logger.debug(f'process_job_state_change | Sending notification message(s) for job {slurm_job_id}')
         try:
-            jobs_coll = mongodb_connection.get_monitor_jobs_collection()
-            result = jobs_coll.find_one({"slurm_job_id": slurm_job_id})
-            if result:
-                task = result["task"]
+            if task is None:
+                jobs_coll = mongodb_connection.get_monitor_jobs_collection()
+                result = jobs_coll.find_one({"slurm_job_id": slurm_job_id}, {"_id": 0, "task": 1})
+                task = result["task"] if result else None
+            if task:
                 task_name = task["name"]
                 task_md = TASK_METADATA[task_name]
                 task_md_notification = task_md["notification"]
@@ -801,82 +1273,160 @@ def process_job_state_change(
                 '''
                 task_md_notification_methods = task_md_notification["methods"]
                 task_md_notification_params = task_md_notification["params"]
-                task_notification_methods = task_md_notification_methods
-                task_notification_params = task_md_notification_params
+                task_notification_methods = list(task_md_notification_methods)
+                task_notification_params = dict(task_md_notification_params)
                 '''
                 If there are custom notification property data in the task itself, merge
                 it with the built-in methods and parameters, where not already existing
                 '''
                 task_custom_notification = task.get("notification", None)
-                app.logger.debug(f'process_job_state_change | Task custom notification: {task_custom_notification}')
+                if app.logger.isEnabledFor(logging.DEBUG):
+                    app.logger.debug(f'process_job_state_change | Task custom notification: {task_custom_notification}')
                 if task_custom_notification:
                     task_custom_notification_methods = task_custom_notification.get("methods", [])
                     task_custom_notification_params = task_custom_notification.get("params", {})
                     for method in task_custom_notification_methods:
                         if method not in task_notification_methods and method in task_custom_notification_params:
                             task_notification_methods.append(method)
-                            task_notification_params[method] = {}
-                            for k, v in task_custom_notification_params[method].items():
-                                task_notification_params[method][k] = copy.deepcopy(v)
+                            task_notification_params[method] = dict(task_custom_notification_params[method])
                 '''
                 Process each method
                 '''
-                if len(task_notification_methods) == 0:
-                    app.logger.warning(
-                        f"process_job_state_change | No notification methods defined for job {slurm_job_id} | {task}"
+                if not task_notification_methods:
+                    # e.g., "generic" tasks, which define no notification methods
+                    app.logger.info(
+                        f"process_job_state_change | No notification methods defined for job {slurm_job_id}"
                     )
+                    return True
+                # unknown methods are reported here, as the messages are sent in the background
+                unknown_notification_methods = [
+                    method for method in task_notification_methods if method not in NOTIFICATION_DISPATCH
+                ]
+                for method in unknown_notification_methods:
+                    app.logger.error(
+                        f"process_job_state_change | Unknown or unimplemented notification method: {method}"
+                    )
+                dispatch_job_state_change_notifications(
+                    slurm_job_id,
+                    [method for method in task_notification_methods if method in NOTIFICATION_DISPATCH],
+                    task_notification_params,
+                )
+                if unknown_notification_methods:
                     return False
-                task_notification_method_factory = NotificationCallbackFactory()
-                for method in task_notification_methods:
-                    msg = f"Sending notification for: {slurm_job_id} using method: {method}"
-                    app.logger.info(f'process_job_state_change | Sending notification message for: {slurm_job_id} via method: {method}')
-                    callback = task_notification_method_factory.create_callback_for_method(method)
-                    if method == NotificationMethod.EMAIL.value or method == NotificationMethod.GMAIL.value:
-                        sender = task_notification_params[method]["sender"]
-                        recipient = task_notification_params[method]["recipient"]
-                        subject = task_notification_params[method]["subject"]
-                        body = msg
-                        try:
-                            callback.notify(
-                                sender,
-                                recipient,
-                                subject,
-                                body,
-                            )
-                        except Exception as err:
-                            app.logger.warning(
-                                f"process_job_state_change | Could not message via email or Gmail: {err}"
-                            )
-                    elif method == NotificationMethod.SLACK.value:
-                        try:
-                            callback.notify(
-                                msg, 
-                                task_notification_params["slack"]["channel"],
-                            )
-                        except Exception as err:
-                            app.logger.warning(
-                                f"process_job_state_change | Could not message via Slack: {err}"
-                            )
-                    elif method == NotificationMethod.RABBITMQ.value:
-                        try:
-                            callback.notify(
-                                task_notification_params["rabbitmq"]["queue"],
-                                task_notification_params["rabbitmq"]["exchange"],
-                                task_notification_params["rabbitmq"]["routing_key"],
-                                msg,
-                            )
-                        except Exception as err:
-                            app.logger.warning(
-                                f"process_job_state_change | Could not message via RabbitMQ: {err}"
-                            )
-                    elif method == NotificationMethod.TEST.value:
-                        callback.notify(msg)
-                    else:
-                        app.logger.error(f"process_job_state_change | Unknown or unimplemented notification method: {method}")
-                        return False
         except pymongo.errors.PyMongoError as err:
             app.logger.error(
                 f"process_job_state_change | Error handling job state change from monitor database query: {err}"
             )
             return False
-    return True
\ No newline at end of file
+    return True
+
+
+def send_job_state_change_notification(
+    slurm_job_id: int,
+    method: str,
+    task_notification_params: dict,
+) -> bool:
+    """
+    Send the notification message for a job state change via the given
+    notification method.
+
+    Args:
+        slurm_job_id (int): The SLURM job ID.
+        method (str): The notification method to use.
+        task_notification_params (dict): The parameters of each notification method.
+
+    Returns:
+        bool: True if the notification method is known, False otherwise.
+    """
+    app = get_slurm_proxy_app()
+    msg = f"Sending notification for: {slurm_job_id} using method: {method}"
+    app.logger.info(f'send_job_state_change_notification | Sending notification message for: {slurm_job_id} via method: {method}')
+    dispatch = NOTIFICATION_DISPATCH.get(method)
+    if not dispatch:
+        app.logger.error(f"send_job_state_change_notification | Unknown or unimplemented notification method: {method}")
+        return False
+    method_name, notify_args = dispatch
+    callback = notification_callbacks.get(method)
+    if not callback:
+        callback = NotificationCallbackFactory.create_callback_for_method(method)
+        notification_callbacks[method] = callback
+    try:
+        callback.notify(*notify_args(task_notification_params, msg))
+    except Exception as err:
+        app.logger.warning(
+            f"send_job_state_change_notification | Could not message via {method_name}: {err}"
+        )
+    return True
+
+
+def get_notification_executor() -> tuple:
+    """
+    Get the thread pool used to send notification messages, along with the semaphore
+    that bounds the number of pending notifications.
+
+    The pool is created on first use in each process, as threads do not survive
+    the fork of uWSGI workers.
+
+    Returns:
+        tuple: The ThreadPoolExecutor and its BoundedSemaphore.
+    """
+    with notification_executor_lock:
+        pid = os.getpid()
+        if notification_executor_state["pid"] != pid:
+            notification_executor_state["pid"] = pid
+            notification_executor_state["executor"] = ThreadPoolExecutor(
+                max_workers=NOTIFICATIONS_MAX_WORKERS,
+                thread_name_prefix="notification",
+            )
+            notification_executor_state["pending"] = BoundedSemaphore(NOTIFICATIONS_MAX_PENDING)
+        return notification_executor_state["executor"], notification_executor_state["pending"]
+
+
+def dispatch_job_state_change_notifications(
+    slurm_job_id: int,
+    task_notification_methods: list,
+    task_notification_params: dict,
+) -> None:
+    """
+    Send the notification message(s) for a job state change from the notification
+    thread pool, so that the caller does not wait on the notification services.
+    Each method is sent as a separate task, so that messages via different methods
+    are sent concurrently.
+
+    If `NOTIFICATIONS_MAX_PENDING` notifications are already waiting to be sent,
+    the message(s) are sent from the calling thread instead, rather than dropped.
+
+    Args:
+        slurm_job_id (int): The SLURM job ID.
+        task_notification_methods (list): The notification methods to use.
+        task_notification_params (dict): The parameters of each notification method.
+    """
+    app = get_slurm_proxy_app()
+    executor, pending = get_notification_executor()
+
+    def send(method):
+        try:
+            send_job_state_change_notification(slurm_job_id, method, task_notification_params)
+        except Exception as err:
+            app.logger.error(
+                f"dispatch_job_state_change_notifications | Could not send {method} notification for job {slurm_job_id}: {err}"
+            )
+        finally:
+            pending.release()
+
+    for method in task_notification_methods:
+        if not pending.acquire(blocking=False):
+            app.logger.warning(
+                f"dispatch_job_state_change_notifications | Notification queue is full, sending {method} notification for job {slurm_job_id} directly"
+            )
+            send_job_state_change_notification(slurm_job_id, method, task_notification_params)
+            continue
+        try:
+            executor.submit(send, method)
+        except RuntimeError as err:
+            # e.g., the executor has been shut down at interpreter exit
+            pending.release()
+            app.logger.warning(
+                f"dispatch_job_state_change_notifications | Could not queue {method} notification for job {slurm_job_id}, sending it directly: {err}"
+            )
+            send_job_state_change_notification(slurm_job_id, method, task_notification_params)
@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 
 import re
-import sys
 import pika
 import base64
 import smtplib
@@ -304,4 +303,8 @@ class NotificationMethodCallback:
         Args:
             msg (str): The message to be sent.
         """
-        print(f" * {msg}", file=sys.stderr)
\ No newline at end of file
+        from app.helpers import (
+            get_slurm_proxy_app,
+        )
+        app = get_slurm_proxy_app()
+        app.logger.info(f"notify_via_test | {msg}")
\ No newline at end of file
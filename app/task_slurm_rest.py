@@ -3,8 +3,8 @@
 import os
 import json
 import time
+import functools
 import subprocess
-import requests
 from flask import (
     Blueprint,
     Response,
@@ -18,9 +18,12 @@ from app.constants import (
     SLURM_REST_SLURM_ENDPOINT_URL,
     SLURM_REST_SLURMDB_ENDPOINT_URL,
     SLURM_REST_JWT_EXPIRATION_TIME,
+    SLURM_REST_JWT_EXPIRATION_SKEW,
     SLURM_REST_GENERIC_USERNAME,
 )
 from app.task_ssh_client import ssh_client_connection_singleton
+from app.task_slurm_rest_client import slurm_rest_client_connection_singleton
+from threading import Lock
 from typing import TypedDict
 from typing_extensions import Unpack
 from collections.abc import Callable
@@ -33,6 +36,14 @@ https://slurm.schedmd.com/SLUG23/REST-API-SLUG23.pdf
 """
 
 ssh_connection = ssh_client_connection_singleton
+slurm_rest_connection = slurm_rest_client_connection_singleton
+
+"""
+Minted JWT tokens, keyed by username, as (token, expiry) tuples where
+expiry is a time.monotonic() value
+"""
+slurm_rest_jwt_tokens = {}
+slurm_rest_jwt_tokens_lock = Lock()
 
 
 class QueryParams(TypedDict, total=False):
@@ -44,6 +55,8 @@ class QueryParams(TypedDict, total=False):
 
     job_id: int
     update_time: int
+    users: str
+    start_time: int
 
 
 task_slurm_rest = Blueprint("task_slurm_rest", __name__)
@@ -121,56 +134,94 @@ def get_job_info_for_job_id(job_id: int) -> Response:
     )
 
 
-def get_job_info_for_job_id_via_params(job_id: int, username: str) -> Response:
+def query_slurmdb_endpoint_via_params(
+    caller: str, endpoint_key: str, username: str, **kwargs: Unpack[QueryParams]
+) -> tuple:
     """
-    GET request handler for SLURM job information.
-    This function retrieves the SLURM REST token from the request headers
-    and returns it in the response, along with information about a specific job.
+    Issue a GET request to the SLURM REST slurmdb endpoint on behalf of a user.
 
-    ref. https://slurm.schedmd.com/rest_api.html#slurmdbV0042GetJob (request)
-    ref. https://slurm.schedmd.com/rest_api.html#v0.0.42_openapi_slurmdbd_jobs_resp (response)
+    Args:
+        caller (str): The name of the calling function, used as the log prefix.
+        endpoint_key (str): The slurmdb endpoint key (e.g., "job" or "jobs").
+        username (str): The username for whom the JWT token is issued.
+        **kwargs: Query parameters for the endpoint.
+
+    Returns:
+        tuple: The decoded JSON response (or None), the HTTP status code, and the query URL.
     """
     app = get_slurm_proxy_app()
     if not username:
         username = SLURM_REST_GENERIC_USERNAME
 
     endpoint_url = SLURM_REST_SLURMDB_ENDPOINT_URL
-    endpoint_key = "job"
     endpoint_method = "GET"
-    kwargs = {"job_id": job_id}
     query_url = get_slurm_rest_query(endpoint_url, endpoint_key, **kwargs)
     slurm_rest_auth_token = get_slurm_rest_jwt_token_for_username(username)
     if not slurm_rest_auth_token:
         app.logger.error(
-            f"get_job_info_for_job_id_via_params | Failed to retrieve SLURM REST auth token for username: {username}"
-        )
-        return (
-            stream_json_response(
-                {"error": "Failed to retrieve SLURM REST auth token"}, 400
-            ),
-            400,
-            query_url,
+            f"{caller} | Failed to retrieve SLURM REST auth token for username: {username}"
         )
+        return None, 400, query_url
     headers = {
         "X-SLURM-USER-TOKEN": slurm_rest_auth_token,
     }
-    response = requests.request(endpoint_method, query_url, headers=headers)
+    response = slurm_rest_connection.request(endpoint_method, query_url, headers=headers)
     if response.status_code != 200:
         app.logger.error(
-            f"get_job_info_for_job_id_via_params | {response.status_code} - {response.text}"
+            f"{caller} | {response.status_code} - {response.text}"
         )
-    response_content = ""
-    for chunk in response.iter_content(chunk_size=None):
-        response_content += chunk.decode("utf-8")
     try:
-        response_json_content = json.loads(response_content)
-    except json.JSONDecodeError as err:
+        response_json_content = response.json()
+    except ValueError as err:
         app.logger.error(
-            f"get_job_info_for_job_id_via_params | JSON decoding failed - {err}"
+            f"{caller} | JSON decoding failed - {err}"
         )
+        response_json_content = None
     return response_json_content, response.status_code, query_url
 
 
+def get_job_info_for_job_id_via_params(job_id: int, username: str) -> tuple:
+    """
+    Get SLURM job information for a specific job, via the SLURM REST API job endpoint.
+
+    ref. https://slurm.schedmd.com/rest_api.html#slurmdbV0042GetJob (request)
+    ref. https://slurm.schedmd.com/rest_api.html#v0.0.42_openapi_slurmdbd_jobs_resp (response)
+    """
+    return query_slurmdb_endpoint_via_params(
+        "get_job_info_for_job_id_via_params",
+        "job",
+        username,
+        job_id=job_id,
+    )
+
+
+def get_jobs_info_for_username_via_params(username: str, start_time: int) -> tuple:
+    """
+    Get SLURM job information for all jobs of a user, with a single query to the
+    SLURM REST API jobs endpoint, filtered by username and start time.
+
+    ref. https://slurm.schedmd.com/rest_api.html#slurmdbV0042GetJobs (request)
+    ref. https://slurm.schedmd.com/rest_api.html#v0.0.42_openapi_slurmdbd_jobs_resp (response)
+
+    Args:
+        username (str): The username whose jobs are queried, and for whom the JWT
+            token is issued.
+        start_time (int): Only jobs submitted at or after this UNIX timestamp are returned.
+
+    Returns:
+        tuple: The decoded JSON response (or None), the HTTP status code, and the query URL.
+    """
+    if not username:
+        username = SLURM_REST_GENERIC_USERNAME
+    return query_slurmdb_endpoint_via_params(
+        "get_jobs_info_for_username_via_params",
+        "jobs",
+        username,
+        users=username,
+        start_time=start_time,
+    )
+
+
 @task_slurm_rest.route("/job/submit/", methods=["POST"], strict_slashes=False)
 def submit_job() -> Response:
     """
@@ -286,7 +337,40 @@ def get_slurm_rest_jwt_private_key_via_env() -> str:
     return slurm_private_key.strip()
 
 
+@functools.lru_cache(maxsize=1)
+def get_slurm_rest_jwt_signing_key(priv_key: str):
+    """
+    Get the signing key for SLURM REST API JWT tokens, decoded from the base64
+    private key. The decoded key is cached, and only rebuilt if the private key
+    changes.
+
+    Args:
+        priv_key (str): The base64-encoded HS256 private key.
+
+    Returns:
+        jwt.jwk.OctetJWK: The signing key.
+    """
+    return jwk_from_dict(
+        {
+            "kty": "oct",
+            "k": priv_key,
+        }
+    )
+
+
 def get_slurm_rest_jwt_token_for_username(username: str) -> str:
+    """
+    Get a signed SLURM REST API JWT token for the specified username.
+
+    Tokens are cached per username and reused until they are within
+    SLURM_REST_JWT_EXPIRATION_SKEW seconds of expiring.
+
+    Args:
+        username (str): The username the token is issued for.
+
+    Returns:
+        str: The JWT token, or None if the signing key is not available.
+    """
     # if not username or username == SLURM_REST_GENERIC_USERNAME:
     #     return None
     app = get_slurm_proxy_app()
@@ -295,6 +379,10 @@ def get_slurm_rest_jwt_token_for_username(username: str) -> str:
             f"get_slurm_rest_jwt_token_for_username | Username not provided"
         )
         username = SLURM_REST_GENERIC_USERNAME
+    with slurm_rest_jwt_tokens_lock:
+        cached_token = slurm_rest_jwt_tokens.get(username)
+    if cached_token and time.monotonic() < cached_token[1]:
+        return cached_token[0]
     priv_key = get_slurm_rest_jwt_private_key_via_env()
     if not priv_key:
         # print(" * Error: Failed to retrieve SLURM JWT private key", file=sys.stderr)
@@ -302,12 +390,7 @@ def get_slurm_rest_jwt_token_for_username(username: str) -> str:
             f"get_slurm_rest_jwt_token_for_username | Failed to retrieve SLURM JWT private key"
         )
         return None
-    signing_key = jwk_from_dict(
-        {
-            "kty": "oct",
-            "k": priv_key,
-        }
-    )
+    signing_key = get_slurm_rest_jwt_signing_key(priv_key)
     message = {
         "exp": int(time.time() + SLURM_REST_JWT_EXPIRATION_TIME),
         "iat": int(time.time()),
@@ -315,6 +398,11 @@ def get_slurm_rest_jwt_token_for_username(username: str) -> str:
     }
     a = JWT()
     compact_jws = a.encode(message, signing_key, alg="HS256")
+    with slurm_rest_jwt_tokens_lock:
+        slurm_rest_jwt_tokens[username] = (
+            compact_jws,
+            time.monotonic() + SLURM_REST_JWT_EXPIRATION_TIME - SLURM_REST_JWT_EXPIRATION_SKEW,
+        )
     app.logger.debug(
         f"get_slurm_rest_jwt_token_for_username | SLURM_JWT={compact_jws} | username={username}"
     )
@@ -416,7 +504,7 @@ def query_slurm_get_endpoint_via_requests(
     headers = {
         "X-SLURM-USER-TOKEN": slurm_rest_auth_token,
     }
-    response = requests.request(endpoint_method, query_url, headers=headers)
+    response = slurm_rest_connection.request(endpoint_method, query_url, headers=headers)
     if response.status_code != 200:
         app.logger.error(
             f"query_slurm_get_endpoint_via_requests | Error: {response.status_code} - {response.text}"
@@ -442,7 +530,7 @@ def query_slurm_post_endpoint_via_requests(
     job = kwargs["kwargs"]
     if "job" in job:
         job = job["job"]
-    response = requests.request(endpoint_method, query_url, headers=headers, json=job)
+    response = slurm_rest_connection.request(endpoint_method, query_url, headers=headers, json=job)
     if response.status_code != 200:
         json_content = response.json()
         errors = json_content.get("errors", None)
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+import os
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from threading import Lock
+from app.constants import (
+    SLURM_REST_POOL_CONNECTIONS,
+    SLURM_REST_POOL_MAXSIZE,
+    SLURM_REST_CONNECT_TIMEOUT,
+    SLURM_REST_READ_TIMEOUT,
+    SLURM_REST_MAX_RETRIES,
+)
+
+
+class SlurmRESTClientConnection:
+    '''
+    Process-wide HTTP session for the SLURM REST API. Connections are pooled and
+    kept alive, so that repeated queries (e.g., when polling job status) do not
+    each pay for a new TCP and TLS handshake. The session is recreated if the
+    process has been forked since it was created.
+
+    Requests time out after `SLURM_REST_CONNECT_TIMEOUT` and `SLURM_REST_READ_TIMEOUT`
+    seconds, unless a timeout is given, and idempotent requests are retried on
+    connection errors and gateway errors.
+    '''
+
+    _instance = None
+    _lock = Lock()
+
+    def __new__(cls):
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(SlurmRESTClientConnection, cls).__new__(cls)
+                    cls._instance.init_session()
+        return cls._instance
+
+    def init_session(self):
+        self._pid = os.getpid()
+        self._session = requests.Session()
+        retry = Retry(
+            total=SLURM_REST_MAX_RETRIES,
+            backoff_factor=0.1,
+            status_forcelist=(502, 503, 504),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=SLURM_REST_POOL_CONNECTIONS,
+            pool_maxsize=SLURM_REST_POOL_MAXSIZE,
+            max_retries=retry,
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def get_session(self) -> requests.Session:
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self.init_session()
+        return self._session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request to the SLURM REST API over the pooled session.
+
+        Args:
+            method (str): The HTTP method for the request (GET, POST, etc.).
+            url (str): The URL for the request.
+            **kwargs: Additional parameters passed to `requests.Session.request`.
+
+        Returns:
+            requests.Response: The response from the SLURM REST API.
+        """
+        kwargs.setdefault("timeout", (SLURM_REST_CONNECT_TIMEOUT, SLURM_REST_READ_TIMEOUT))
+        return self.get_session().request(method, url, **kwargs)
+
+
+slurm_rest_client_connection_singleton = SlurmRESTClientConnection()
@@ -1,33 +1,47 @@
 # -*- coding: utf-8 -*-
 
 import os
-import paramiko
 from socket import gaierror
+from typing import TYPE_CHECKING
 from app.constants import (
     SSH_HOSTNAME,
     SSH_USERNAME,
-    SSH_PRIVATE_KEY,
+    SSH_PRIVATE_KEY_PATH,
+    SSH_KEEPALIVE_INTERVAL,
 )
 from threading import Lock
 
+if TYPE_CHECKING:
+    import paramiko
+
 
 class SSHClientConnection:
+    '''
+    Process-wide SSH connection to the SLURM scheduler. Paramiko (and the
+    cryptography modules it loads) is only imported when the SSH client is first
+    needed, so that deployments communicating via the SLURM REST API do not pay
+    for it at startup.
+    '''
 
     _instance = None
     _lock = Lock()
+    _connect_lock = Lock()
 
     def __new__(cls):
         if not cls._instance:
             with cls._lock:
                 if not cls._instance:
                     cls._instance = super(SSHClientConnection, cls).__new__(cls)
-                    cls._instance._ssh_client = cls._instance.init_ssh_client()
+                    cls._instance._ssh_client = None
+                    cls._instance._ssh_private_key = None
         return cls._instance
 
-    def get_ssh_client(self) -> paramiko.SSHClient:
+    def get_ssh_client(self) -> "paramiko.SSHClient":
+        if not self._ssh_client:
+            self._ssh_client = self.init_ssh_client()
         return self._ssh_client
 
-    def init_ssh_client(self) -> paramiko.SSHClient:
+    def init_ssh_client(self) -> "paramiko.SSHClient":
         """
         Create an SSH client to connect to the SLURM scheduler.
         This function uses the Paramiko library to create an SSH client
@@ -36,11 +50,76 @@ class SSHClientConnection:
         Returns:
             paramiko.SSHClient: An SSH client object configured to connect to the SLURM scheduler.
         """
+        import paramiko
         ssh_client = paramiko.SSHClient()
         ssh_client.load_system_host_keys()
         ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
         return ssh_client
 
+    def get_ssh_private_key(self) -> "paramiko.PKey":
+        """
+        Get the private key used to authenticate the SSH connection.
+
+        The key is loaded from `SSH_PRIVATE_KEY_PATH` on first use, rather than
+        when the application starts, and the parsed key is kept for subsequent
+        connections. If it cannot be loaded, loading is attempted again on the
+        next connection.
+
+        Returns:
+            paramiko.PKey: The private key, or None if it could not be loaded.
+        """
+        import paramiko
+        if isinstance(self._ssh_private_key, paramiko.PKey):
+            return self._ssh_private_key
+        try:
+            self._ssh_private_key = paramiko.Ed25519Key.from_private_key_file(SSH_PRIVATE_KEY_PATH)
+        except FileNotFoundError as err:
+            from app import slurm_proxy_app
+            app = slurm_proxy_app.SlurmProxyApp.app()
+            app.logger.error(f"get_ssh_private_key | SSH key not found: {err}")
+            self._ssh_private_key = None
+        return self._ssh_private_key
+
+    def is_ssh_client_connected(self) -> bool:
+        """
+        Test if the SSH client has an active transport to the SLURM scheduler.
+
+        Returns:
+            bool: True if the SSH client is connected, False otherwise.
+        """
+        transport = self._ssh_client.get_transport() if self._ssh_client else None
+        return transport is not None and transport.is_active()
+
+    def connect_ssh_client(self) -> None:
+        """
+        Connect the SSH client to the SLURM scheduler, if it is not already connected.
+
+        The connection is kept open, so that subsequent commands are run over new
+        channels of the same transport, without repeating the TCP and SSH handshakes.
+        If the transport has been dropped, a new connection is made.
+        """
+        with self._connect_lock:
+            if self.is_ssh_client_connected():
+                return
+            self.get_ssh_client().connect(
+                hostname=SSH_HOSTNAME,
+                username=SSH_USERNAME,
+                pkey=self.get_ssh_private_key(),
+                look_for_keys=False,
+                allow_agent=False,
+                timeout=10,
+            )
+            self._ssh_client.get_transport().set_keepalive(SSH_KEEPALIVE_INTERVAL)
+
+    def close_ssh_client(self) -> None:
+        """
+        Close the SSH client's connection to the SLURM scheduler, so that the next
+        command makes a new connection.
+        """
+        with self._connect_lock:
+            if self._ssh_client:
+                self._ssh_client.close()
+
     def ssh_client_exec(self, cmd: str) -> tuple:
         """
         Execute a command via SSH.
@@ -48,7 +127,11 @@ class SSHClientConnection:
         The private key for the SSH connection is obtained via the SSH agent.
 
         This function uses the provided SSH client to execute a command on
-        the SLURM scheduler and returns the output and error streams.
+        the SLURM scheduler and returns the output and error streams. The SSH
+        connection is only established if it is not already open. If a channel
+        cannot be opened on the open connection (e.g., because it was dropped by
+        the server), the connection is re-established and the command is retried
+        once.
 
         Args:
             ssh_client (paramiko.SSHClient): The SSH client used to connect to the SLURM scheduler.
@@ -57,30 +140,29 @@ class SSHClientConnection:
         Returns:
             tuple: A tuple containing the output and error streams of the executed command.
         """
+        import paramiko
         from app import slurm_proxy_app
         app = slurm_proxy_app.SlurmProxyApp.app()
-        try:
-            if not self._ssh_client:
-                self._ssh_client = self.init_ssh_client()
-
-            self._ssh_client.connect(
-                hostname=SSH_HOSTNAME,
-                username=SSH_USERNAME,
-                pkey=SSH_PRIVATE_KEY,
-                look_for_keys=False,
-                allow_agent=False,
-                timeout=10,
-            )
-            return self._ssh_client.exec_command(cmd)
-        except gaierror as err:
-            app.logger.error(f"SSH connection failed: {err}")
-            self.report_ssh_environment()
-        except paramiko.SSHException as err:
-            app.logger.error(f"SSH connection failed: {err}")
-            self.report_ssh_environment()
-        except paramiko.AuthenticationException as err:
-            app.logger.error(f"SSH authentication failed: {err}")
-            self.report_ssh_environment()
+        for attempt in range(2):
+            try:
+                self.connect_ssh_client()
+                return self._ssh_client.exec_command(cmd)
+            except gaierror as err:
+                app.logger.error(f"SSH connection failed: {err}")
+                self.report_ssh_environment()
+                return None
+            except paramiko.AuthenticationException as err:
+                app.logger.error(f"SSH authentication failed: {err}")
+                self.report_ssh_environment()
+                return None
+            except (paramiko.SSHException, EOFError) as err:
+                if attempt == 0:
+                    app.logger.warning(f"ssh_client_exec | SSH channel failed, reconnecting: {err}")
+                    self.close_ssh_client()
+                    continue
+                app.logger.error(f"SSH connection failed: {err}")
+                self.report_ssh_environment()
+                return None
 
     def report_ssh_environment(self):
         from app import slurm_proxy_app
@@ -92,7 +174,7 @@ class SSHClientConnection:
             f"SSH_USERNAME={os.environ.get('SSH_USERNAME', SSH_USERNAME)}",
         )
         app.logger.error(
-            f"SSH_PRIVATE_KEY={os.environ.get('SSH_PRIVATE_KEY', SSH_PRIVATE_KEY)}",
+            f"SSH_PRIVATE_KEY={os.environ.get('SSH_PRIVATE_KEY', self._ssh_private_key)}",
         )
         app.logger.error(f"SSH_AUTH_SOCK={os.environ.get('SSH_AUTH_SOCK')}")
 
@@ -10,8 +10,12 @@ from app.constants import (
     APP_HOST,
     APP_DEBUG_MODE,
     APP_USE_RELOADER,
+    APP_RELOADER_ENV,
 )
 
+if APP_USE_RELOADER:
+    os.environ[APP_RELOADER_ENV] = "true"
+
 from app import slurm_proxy_app
 
 app = slurm_proxy_app.SlurmProxyApp.app() # singleton
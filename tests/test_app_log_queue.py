@@ -0,0 +1,91 @@
+import unittest
+from unittest.mock import patch, MagicMock
+
+import sys
+from pathlib import Path
+
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+sys.path.append(str(root))
+# the application is created on import, which otherwise requires MongoDB
+with patch("app.helpers.ping_mongodb_client"), patch("app.helpers.create_mongodb_indexes"):
+    from app.slurm_proxy_app import SlurmProxyApp
+
+
+@patch("app.slurm_proxy_app.QueueListener")
+class TestLogListenerFork(unittest.TestCase):
+    def setUp(self):
+        state_patcher = patch.multiple(
+            SlurmProxyApp,
+            _log_listener=None,
+            _log_listener_running=False,
+            _log_listener_paused=False,
+            _log_queue_handler=MagicMock(),
+            _log_handlers=[],
+        )
+        state_patcher.start()
+        self.addCleanup(state_patcher.stop)
+
+    def test_pause_and_resume_in_parent(self, mock_listener_cls):
+        SlurmProxyApp.start_log_listener()
+        listener = mock_listener_cls.return_value
+        queue = SlurmProxyApp._log_queue_handler.queue
+
+        SlurmProxyApp.pause_log_listener()
+        listener.stop.assert_called_once()
+        self.assertFalse(SlurmProxyApp._log_listener_running)
+
+        SlurmProxyApp.resume_log_listener()
+        self.assertEqual(listener.start.call_count, 2)
+        self.assertTrue(SlurmProxyApp._log_listener_running)
+        # the parent keeps its queue, so that records logged during the fork are written
+        self.assertIs(SlurmProxyApp._log_queue_handler.queue, queue)
+
+    def test_restart_in_child(self, mock_listener_cls):
+        parent_listener, child_listener = MagicMock(), MagicMock()
+        mock_listener_cls.side_effect = [parent_listener, child_listener]
+        SlurmProxyApp.start_log_listener()
+        queue = SlurmProxyApp._log_queue_handler.queue
+
+        SlurmProxyApp.pause_log_listener()
+        SlurmProxyApp.start_log_listener()
+
+        parent_listener.start.assert_called_once()
+        child_listener.start.assert_called_once()
+        self.assertIs(SlurmProxyApp._log_listener, child_listener)
+        self.assertIsNot(SlurmProxyApp._log_queue_handler.queue, queue)
+        self.assertTrue(SlurmProxyApp._log_listener_running)
+
+    def test_not_resumed_if_stopped(self, mock_listener_cls):
+        SlurmProxyApp.start_log_listener()
+        listener = mock_listener_cls.return_value
+        SlurmProxyApp.stop_log_listener()
+
+        SlurmProxyApp.pause_log_listener()
+        SlurmProxyApp.resume_log_listener()
+
+        listener.stop.assert_called_once()
+        listener.start.assert_called_once()
+        self.assertFalse(SlurmProxyApp._log_listener_running)
+
+    @patch("app.slurm_proxy_app.atexit.register")
+    @patch("app.slurm_proxy_app.os.register_at_fork")
+    @patch("app.slurm_proxy_app.logging.getLogger")
+    def test_fork_hooks_registered(
+        self, mock_get_logger, mock_register_at_fork, mock_atexit_register, mock_listener_cls
+    ):
+        mock_get_logger.return_value.handlers = [MagicMock()]
+        with patch.object(SlurmProxyApp, "_log_queue_initialized", False):
+            SlurmProxyApp.init_log_queue()
+            SlurmProxyApp.init_log_queue()
+
+        mock_register_at_fork.assert_called_once_with(
+            before=SlurmProxyApp.pause_log_listener,
+            after_in_parent=SlurmProxyApp.resume_log_listener,
+            after_in_child=SlurmProxyApp.start_log_listener,
+        )
+        mock_atexit_register.assert_called_once_with(SlurmProxyApp.stop_log_listener)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+from unittest.mock import patch, MagicMock
+
+import sys
+from pathlib import Path
+
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+sys.path.append(str(root))
+from app.task_monitoring import (
+    parse_sacct_job_status_lines,
+    update_job_state_in_monitor_db,
+)
+
+
+class TestParseSacctJobStatusLines(unittest.TestCase):
+    def test_parse_lines(self):
+        output = (
+            "123|abcd1234|COMPLETED|username|partition|UNLIMITED|2025-04-14T08:57:46|2025-04-14T11:00:44|02:02:58\n"
+            "123.batch|batch|COMPLETED||||2025-04-14T08:57:46|2025-04-14T11:00:44|02:02:58\n"
+        )
+        result = list(parse_sacct_job_status_lines(output))
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[0]["job_id"], "123")
+        self.assertEqual(result[0]["user"], "username")
+        self.assertEqual(result[0]["elapsed"], "02:02:58")
+        # empty fields are kept as empty strings, so that later fields keep their keys
+        self.assertEqual(result[1]["user"], "")
+        self.assertEqual(result[1]["start"], "2025-04-14T08:57:46")
+
+    def test_parse_odd_fields(self):
+        output = [
+            "\n",
+            '124|"quoted name|RUNNING|username\n',
+            "125|name|PENDING|username|partition|UNLIMITED|Unknown|Unknown|00:00:00|extra\n",
+        ]
+        result = list(parse_sacct_job_status_lines(output))
+        # blank lines are skipped
+        self.assertEqual(len(result), 2)
+        # quotes are not treated specially, and missing trailing fields are absent
+        self.assertEqual(result[0]["job_name"], '"quoted name')
+        self.assertEqual(result[0]["user"], "username")
+        self.assertNotIn("partition", result[0])
+        # extra fields beyond the requested format are dropped
+        self.assertEqual(result[1]["elapsed"], "00:00:00")
+        self.assertEqual(len(result[1]), 9)
+
+    def test_parse_empty(self):
+        self.assertEqual(list(parse_sacct_job_status_lines("")), [])
+        self.assertEqual(list(parse_sacct_job_status_lines([])), [])
+
+
+@patch("app.task_monitoring.get_slurm_proxy_app")
+@patch("app.task_monitoring.mongodb_connection")
+class TestUpdateJobStateInMonitorDb(unittest.TestCase):
+    def test_update_matches_old_state(self, mock_mongodb_connection, mock_get_app):
+        jobs_coll = mock_mongodb_connection.get_monitor_jobs_collection.return_value
+        jobs_coll.find_one_and_update.return_value = {"_id": 1}
+
+        result = update_job_state_in_monitor_db(123, "COMPLETED", "RUNNING")
+
+        self.assertTrue(result)
+        query = jobs_coll.find_one_and_update.call_args[0][0]
+        self.assertEqual(query, {"slurm_job_id": 123, "slurm_job_state": "RUNNING"})
+
+    def test_update_state_already_changed(self, mock_mongodb_connection, mock_get_app):
+        jobs_coll = mock_mongodb_connection.get_monitor_jobs_collection.return_value
+        jobs_coll.find_one_and_update.return_value = None
+
+        result = update_job_state_in_monitor_db(123, "COMPLETED", "RUNNING")
+
+        self.assertFalse(result)
+
+    def test_update_without_old_state(self, mock_mongodb_connection, mock_get_app):
+        jobs_coll = mock_mongodb_connection.get_monitor_jobs_collection.return_value
+        jobs_coll.find_one_and_update.return_value = {"_id": 1}
+
+        result = update_job_state_in_monitor_db(123, "RUNNING")
+
+        self.assertTrue(result)
+        query = jobs_coll.find_one_and_update.call_args[0][0]
+        self.assertEqual(query, {"slurm_job_id": 123})
+
+
+if __name__ == "__main__":
+    unittest.main()
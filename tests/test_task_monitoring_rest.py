@@ -0,0 +1,162 @@
+import unittest
+from unittest.mock import patch, MagicMock
+
+import sys
+from pathlib import Path
+
+file = Path(__file__).resolve()
+parent, root = file.parent, file.parents[1]
+sys.path.append(str(root))
+import app.task_monitoring
+import app.task_slurm_rest
+from app.task_monitoring import (
+    get_current_slurm_job_metadata_by_slurm_job_id_via_rest,
+    update_job_state_in_monitor_db,
+    update_job_states_in_monitor_db,
+)
+from app.task_slurm_rest import get_slurm_rest_jwt_token_for_username
+
+
+@patch("app.task_monitoring.get_slurm_proxy_app")
+@patch("app.task_monitoring.SLURM_REST_JOB_STATUS_CACHE_STALE_TTL", 30)
+@patch("app.task_monitoring.SLURM_REST_JOB_STATUS_CACHE_TTL", 2)
+@patch("app.task_monitoring.time.monotonic")
+@patch("app.task_monitoring.query_current_slurm_job_metadata_by_slurm_job_id_via_rest")
+class TestSlurmRestJobStatusCache(unittest.TestCase):
+    def setUp(self):
+        cache_patcher = patch.dict(app.task_monitoring.slurm_rest_job_status_cache, clear=True)
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+
+    def test_cached_until_ttl_expiry(self, mock_query, mock_monotonic, mock_get_app):
+        first, second = MagicMock(), MagicMock()
+        mock_query.side_effect = [first, second]
+
+        mock_monotonic.return_value = 100.0
+        self.assertIs(get_current_slurm_job_metadata_by_slurm_job_id_via_rest(456, "username"), first)
+        mock_monotonic.return_value = 101.9
+        self.assertIs(get_current_slurm_job_metadata_by_slurm_job_id_via_rest(456, "username"), first)
+        self.assertEqual(mock_query.call_count, 1)
+
+        mock_monotonic.return_value = 102.0
+        self.assertIs(get_current_slurm_job_metadata_by_slurm_job_id_via_rest(456, "username"), second)
+        self.assertEqual(mock_query.call_count, 2)
+
+    def test_cached_per_username(self, mock_query, mock_monotonic, mock_get_app):
+        mock_query.side_effect = [MagicMock(), MagicMock()]
+        mock_monotonic.return_value = 100.0
+
+        get_current_slurm_job_metadata_by_slurm_job_id_via_rest(456, "username")
+        get_current_slurm_job_metadata_by_slurm_job_id_via_rest(456, "other")
+
+        self.assertEqual(mock_query.call_count, 2)
+
+    def test_stale_result_on_failure(self, mock_query, mock_monotonic, mock_get_app):
+        cached = MagicMock()
+        mock_query.side_effect = [cached, None]
+
+        mock_monotonic.return_value = 100.0
+        get_current_slurm_job_metadata_by_slurm_job_id_via_rest(456, "username")
+        mock_monotonic.return_value = 131.9
+        result = get_current_slurm_job_metadata_by_slurm_job_id_via_rest(456, "username")
+
+        self.assertIs(result, cached)
+        self.assertEqual(mock_query.call_count, 2)
+
+    def test_no_stale_result_after_stale_ttl(self, mock_query, mock_monotonic, mock_get_app):
+        mock_query.side_effect = [MagicMock(), None]
+
+        mock_monotonic.return_value = 100.0
+        get_current_slurm_job_metadata_by_slurm_job_id_via_rest(456, "username")
+        mock_monotonic.return_value = 132.0
+        result = get_current_slurm_job_metadata_by_slurm_job_id_via_rest(456, "username")
+
+        self.assertIsNone(result)
+
+
+@patch("app.task_monitoring.get_slurm_proxy_app")
+@patch("app.task_monitoring.mongodb_connection")
+class TestSlurmRestJobStatusCacheInvalidation(unittest.TestCase):
+    def setUp(self):
+        cache_patcher = patch.dict(
+            app.task_monitoring.slurm_rest_job_status_cache,
+            {
+                (456, "username"): (MagicMock(), 200.0, 230.0),
+                (456, "other"): (MagicMock(), 200.0, 230.0),
+                (789, "username"): (MagicMock(), 200.0, 230.0),
+            },
+            clear=True,
+        )
+        cache_patcher.start()
+        self.addCleanup(cache_patcher.stop)
+
+    def test_invalidated_on_state_update(self, mock_mongodb_connection, mock_get_app):
+        jobs_coll = mock_mongodb_connection.get_monitor_jobs_collection.return_value
+        jobs_coll.find_one_and_update.return_value = {"_id": 1}
+
+        self.assertTrue(update_job_state_in_monitor_db(456, "COMPLETED", "RUNNING"))
+        self.assertEqual(list(app.task_monitoring.slurm_rest_job_status_cache), [(789, "username")])
+
+    def test_kept_if_state_not_updated(self, mock_mongodb_connection, mock_get_app):
+        jobs_coll = mock_mongodb_connection.get_monitor_jobs_collection.return_value
+        jobs_coll.find_one_and_update.return_value = None
+
+        self.assertFalse(update_job_state_in_monitor_db(456, "COMPLETED", "RUNNING"))
+        self.assertEqual(len(app.task_monitoring.slurm_rest_job_status_cache), 3)
+
+    def test_invalidated_on_bulk_state_update(self, mock_mongodb_connection, mock_get_app):
+        mock_mongodb_connection.bulk_update_jobs.return_value.matched_count = 2
+
+        self.assertTrue(update_job_states_in_monitor_db({456: "COMPLETED", 789: "FAILED"}))
+        self.assertEqual(app.task_monitoring.slurm_rest_job_status_cache, {})
+
+
+@patch("app.task_slurm_rest.get_slurm_proxy_app")
+@patch("app.task_slurm_rest.SLURM_REST_JWT_EXPIRATION_SKEW", 2)
+@patch("app.task_slurm_rest.SLURM_REST_JWT_EXPIRATION_TIME", 10)
+@patch("app.task_slurm_rest.time.monotonic")
+@patch("app.task_slurm_rest.get_slurm_rest_jwt_signing_key")
+@patch("app.task_slurm_rest.get_slurm_rest_jwt_private_key_via_env")
+@patch("app.task_slurm_rest.JWT")
+class TestSlurmRestJwtTokenCache(unittest.TestCase):
+    def setUp(self):
+        tokens_patcher = patch.dict(app.task_slurm_rest.slurm_rest_jwt_tokens, clear=True)
+        tokens_patcher.start()
+        self.addCleanup(tokens_patcher.stop)
+
+    def test_token_reused_until_skew(
+        self, mock_jwt, mock_priv_key, mock_signing_key, mock_monotonic, mock_get_app
+    ):
+        mock_priv_key.return_value = "key"
+        mock_jwt.return_value.encode.side_effect = ["token1", "token2"]
+
+        mock_monotonic.return_value = 100.0
+        self.assertEqual(get_slurm_rest_jwt_token_for_username("username"), "token1")
+        mock_monotonic.return_value = 107.9
+        self.assertEqual(get_slurm_rest_jwt_token_for_username("username"), "token1")
+        mock_monotonic.return_value = 108.0
+        self.assertEqual(get_slurm_rest_jwt_token_for_username("username"), "token2")
+        self.assertEqual(mock_jwt.return_value.encode.call_count, 2)
+
+    def test_token_cached_per_username(
+        self, mock_jwt, mock_priv_key, mock_signing_key, mock_monotonic, mock_get_app
+    ):
+        mock_priv_key.return_value = "key"
+        mock_jwt.return_value.encode.side_effect = ["token1", "token2"]
+        mock_monotonic.return_value = 100.0
+
+        self.assertEqual(get_slurm_rest_jwt_token_for_username("username"), "token1")
+        self.assertEqual(get_slurm_rest_jwt_token_for_username("other"), "token2")
+
+    def test_no_token_without_key(
+        self, mock_jwt, mock_priv_key, mock_signing_key, mock_monotonic, mock_get_app
+    ):
+        mock_priv_key.return_value = None
+        mock_monotonic.return_value = 100.0
+
+        self.assertIsNone(get_slurm_rest_jwt_token_for_username("username"))
+        self.assertEqual(app.task_slurm_rest.slurm_rest_jwt_tokens, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 from unittest.mock import patch, MagicMock
 from flask import Flask, json
+import bson
+from bson.raw_bson import RawBSONDocument
 
 import sys
 from pathlib import Path
@@ -113,5 +115,71 @@ class TestPostRequest(unittest.TestCase):
         self.assertEqual(response.status_code, 400)
 
 
+class TestDeleteRequest(unittest.TestCase):
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.app.register_blueprint(task_monitoring, url_prefix="/")
+        self.client = self.app.test_client()
+        self.job = {
+            "slurm_job_id": 123,
+            "slurm_job_state": "RUNNING",
+            "username": "username",
+            "task": {"uuid": "abcd1234", "notification": {"method": "email"}},
+        }
+
+    def delete(self, mock_mongodb_connection, mock_ssh_connection, headers=None):
+        dummy_stdout = MagicMock()
+        dummy_stdout.channel.recv_exit_status.return_value = 0
+        mock_ssh_connection.ssh_client_exec.return_value = (None, dummy_stdout, MagicMock())
+        jobs_coll = mock_mongodb_connection.get_monitor_jobs_collection.return_value
+        jobs_coll.find_one_and_delete.return_value = self.job and dict(self.job)
+        raw_jobs_coll = mock_mongodb_connection.get_monitor_jobs_raw_collection.return_value
+        raw_jobs_coll.find_one_and_delete.return_value = self.job and RawBSONDocument(bson.encode(self.job))
+        return self.client.delete("/slurm_job_id/123", headers=headers)
+
+    @patch("app.task_monitoring.get_job_metadata_from_monitor_db_by_query")
+    @patch("app.task_monitoring.ssh_connection")
+    @patch("app.task_monitoring.mongodb_connection")
+    @patch("app.task_monitoring.get_slurm_proxy_app")
+    def test_delete_bson_and_json_equivalent(
+        self, mock_get_app, mock_mongodb_connection, mock_ssh_connection, mock_get_metadata
+    ):
+        mock_get_metadata.return_value = {"slurm_job_id": 123}
+
+        json_response = self.delete(mock_mongodb_connection, mock_ssh_connection)
+        bson_response = self.delete(
+            mock_mongodb_connection,
+            mock_ssh_connection,
+            headers={"Accept": "application/bson"},
+        )
+
+        self.assertEqual(json_response.status_code, 200)
+        self.assertEqual(bson_response.status_code, 200)
+        self.assertEqual(bson_response.mimetype, "application/bson")
+        self.assertEqual(bson.decode(bson_response.data), json.loads(json_response.data))
+        self.assertEqual(json.loads(json_response.data), self.job)
+
+    @patch("app.task_monitoring.get_job_metadata_from_monitor_db_by_query")
+    @patch("app.task_monitoring.ssh_connection")
+    @patch("app.task_monitoring.mongodb_connection")
+    @patch("app.task_monitoring.get_slurm_proxy_app")
+    def test_delete_bson_job_removed_after_lookup(
+        self, mock_get_app, mock_mongodb_connection, mock_ssh_connection, mock_get_metadata
+    ):
+        mock_get_metadata.return_value = {"slurm_job_id": 123}
+        self.job = None
+
+        response = self.delete(
+            mock_mongodb_connection,
+            mock_ssh_connection,
+            headers={"Accept": "application/bson"},
+        )
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(
+            response.get_json(), {"error": "Job not found in monitor database"}
+        )
+
+
 if __name__ == "__main__":
     unittest.main()